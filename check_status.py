@@ -9,25 +9,39 @@ import requests
 import psutil
 from pathlib import Path
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
-def check_port_status(port, service_name):
+def snapshot_ports():
+    """Map each local port in use to the PID of the first connection on it."""
+    ports = {}
+    for conn in psutil.net_connections(kind='inet'):
+        if conn.laddr and conn.laddr.port not in ports:
+            ports[conn.laddr.port] = conn.pid
+    return ports
+
+
+def check_port_status(port, service_name, ports=None):
     """Check if a port is in use and what's using it."""
-    for conn in psutil.net_connections():
-        if conn.laddr.port == port:
-            try:
-                proc = psutil.Process(conn.pid)
-                return f"✅ {service_name} (Port {port}): Running - {proc.name()} (PID: {conn.pid})"
-            except:
-                return f"✅ {service_name} (Port {port}): In use by unknown process"
+    if ports is None:
+        ports = snapshot_ports()
+    
+    if port not in ports:
+        return f"❌ {service_name} (Port {port}): Not running"
     
-    return f"❌ {service_name} (Port {port}): Not running"
+    pid = ports[port]
+    try:
+        proc = psutil.Process(pid)
+        return f"✅ {service_name} (Port {port}): Running - {proc.name()} (PID: {pid})"
+    except:
+        return f"✅ {service_name} (Port {port}): In use by unknown process"
 
 
 def check_http_service(url, service_name):
     """Check if an HTTP service is responding."""
     try:
-        response = requests.get(url, timeout=5)
+        # Local services either answer quickly or refuse the connection
+        response = requests.get(url, timeout=(0.5, 2.0))
         if response.status_code == 200:
             return f"✅ {service_name}: Healthy (HTTP 200)"
         else:
@@ -79,24 +93,24 @@ def check_processes():
         ("Dashboard Frontend", ["npm start", "react-scripts start"])
     ]
     
-    results = []
+    # Walk the process table once, matching every service as we go
+    found = {}
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            cmdline = ' '.join(proc.info['cmdline'] or [])
+        except:
+            continue
+        for service_name, process_patterns in patterns:
+            if service_name not in found and any(pattern in cmdline for pattern in process_patterns):
+                found[service_name] = proc.info['pid']
+        if len(found) == len(patterns):
+            break
     
-    for service_name, process_patterns in patterns:
-        found = False
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                cmdline = ' '.join(proc.info['cmdline'] or [])
-                for pattern in process_patterns:
-                    if pattern in cmdline:
-                        results.append(f"✅ {service_name}: Running (PID: {proc.info['pid']})")
-                        found = True
-                        break
-                if found:
-                    break
-            except:
-                continue
-        
-        if not found:
+    results = []
+    for service_name, _ in patterns:
+        if service_name in found:
+            results.append(f"✅ {service_name}: Running (PID: {found[service_name]})")
+        else:
             results.append(f"❌ {service_name}: Not running")
     
     return results
@@ -123,8 +137,9 @@ def main():
         (3000, "Dashboard Frontend")
     ]
     
+    ports = snapshot_ports()
     for port, service in services:
-        status = check_port_status(port, service)
+        status = check_port_status(port, service, ports)
         print(f"  {status}")
     
     # Check process status
@@ -142,9 +157,10 @@ def main():
         ("http://localhost:3000", "Dashboard Frontend")
     ]
     
-    for url, service in http_services:
-        status = check_http_service(url, service)
-        print(f"  {status}")
+    # Probe all services concurrently; results keep the listed order
+    with ThreadPoolExecutor(max_workers=len(http_services)) as executor:
+        for status in executor.map(lambda args: check_http_service(*args), http_services):
+            print(f"  {status}")
     
     print("\n" + "=" * 42)
     print("💡 To start services: python start_services.py")
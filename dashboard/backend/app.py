@@ -4,57 +4,274 @@ Provides API endpoints for the React frontend dashboard
 """
 
 import os
+
+# gevent workers need the stdlib patched before requests, threading and
+# sockets are first used
+USE_GUNICORN = os.getenv("DASHBOARD_WSGI", "").lower() == "gunicorn"
+if USE_GUNICORN:
+    from gevent import monkey
+    monkey.patch_all()
+
 import sys
 import json
+import heapq
+import random
 import asyncio
+import atexit
 import logging
+import queue
+import threading
+import time
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import requests
-from flask import Flask, jsonify, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.http import generate_etag
 
-# Add the main src directory to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
+# Use orjson for response serialization when available
 try:
-    from analytics import analytics
-    from config import settings
-    from models import Platform, Intent, Sentiment
-except ImportError as e:
-    print(f"Warning: Could not import main chatbot modules: {e}")
-    analytics = None
-    settings = None
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None
+    _HAS_ORJSON = False
 
+project_root = Path(__file__).resolve().parents[2]
 
 # Configure logging
-logs_dir = Path(__file__).parent.parent.parent / "logs"
-logs_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(logs_dir / 'dashboard-backend.log'),
-        logging.StreamHandler()
-    ]
-)
+LOGS_DIR = project_root / "logs"
+LOGS_DIR.mkdir(exist_ok=True)
+
+_log_handlers = [
+    logging.FileHandler(LOGS_DIR / 'dashboard-backend.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+if USE_GUNICORN:
+    # gevent workers yield on I/O already, and a listener thread would not survive the fork
+    logging.basicConfig(level=logging.INFO, handlers=_log_handlers)
+else:
+    # Request threads only enqueue records; a listener thread does the file and console I/O
+    _queue_handler = QueueHandler(queue.Queue(-1))
+    _queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+    
+    _log_listener = QueueListener(_queue_handler.queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts for calls to the chatbot API; kept tight so a sick
+# upstream cannot tie up Flask worker threads
+UPSTREAM_TIMEOUT = (0.25, 2.0)
+
+# Seconds /api/real-time-metrics waits for its probes
+PROBE_TIMEOUT = 1.5
+
+# Random source for mock daily figures
+_rng = random.Random()
+
+# Number of intents shown on the intent distribution chart by default
+TOP_INTENTS = 20
+
+# Upper bound for the ?top= parameter on distribution charts
+MAX_CHART_ITEMS = 100
+
+# Mock payloads served when real data is unavailable
+MOCK_KPIS = {
+    "total_users": 1247,
+    "total_messages": 8932,
+    "avg_conversation_length": 4.2,
+    "response_time_ms": 285,
+    "satisfaction_rating": 4.1,
+    "positive_sentiment_percentage": 68.5
+}
+
+MOCK_CONVERSATION_TRENDS = {
+    "labels": ["09/24", "09/25", "09/26", "09/27", "09/28", "09/29", "09/30"],
+    "messages": [120, 135, 98, 167, 143, 189, 156],
+    "conversations": [45, 52, 38, 63, 54, 71, 59]
+}
+
+MOCK_SENTIMENT_DISTRIBUTION = {
+    "labels": ["Positive", "Negative", "Neutral"],
+    "data": [425, 89, 234],
+    "percentages": [56.8, 11.9, 31.3]
+}
+
+MOCK_INTENT_DISTRIBUTION = {
+    "labels": ["question", "greeting", "help", "request", "goodbye", "complaint"],
+    "data": [342, 189, 156, 98, 87, 45]
+}
+
+MOCK_PLATFORM_USAGE = {
+    "labels": ["Web", "API", "Slack", "Telegram"],
+    "data": [456, 234, 123, 89]
+}
+
+MOCK_REAL_TIME_METRICS = {
+    "server_status": "healthy",
+    "chatbot_status": "healthy",
+    "active_sessions": 15,
+    "uptime_hours": 24.5,
+    "messages_per_minute": 8,
+    "average_response_time": 285
+}
+
+# The mocks never change, so encode them once rather than on every fallback
+MOCK_KPIS_JSON = json.dumps(MOCK_KPIS).encode("utf-8")
+MOCK_CONVERSATION_TRENDS_JSON = json.dumps(MOCK_CONVERSATION_TRENDS).encode("utf-8")
+MOCK_SENTIMENT_DISTRIBUTION_JSON = json.dumps(MOCK_SENTIMENT_DISTRIBUTION).encode("utf-8")
+MOCK_INTENT_DISTRIBUTION_JSON = json.dumps(MOCK_INTENT_DISTRIBUTION).encode("utf-8")
+MOCK_PLATFORM_USAGE_JSON = json.dumps(MOCK_PLATFORM_USAGE).encode("utf-8")
+MOCK_REAL_TIME_METRICS_JSON = json.dumps(MOCK_REAL_TIME_METRICS).encode("utf-8")
+
+# The mock bodies never change, so their ETags are hashed once here instead of per request
+MOCK_ETAGS = {
+    body: generate_etag(body)
+    for body in (
+        MOCK_KPIS_JSON,
+        MOCK_CONVERSATION_TRENDS_JSON,
+        MOCK_SENTIMENT_DISTRIBUTION_JSON,
+        MOCK_INTENT_DISTRIBUTION_JSON,
+        MOCK_PLATFORM_USAGE_JSON,
+        MOCK_REAL_TIME_METRICS_JSON,
+    )
+}
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson, straight to bytes for responses."""
+    
+    option = orjson.OPT_NON_STR_KEYS if _HAS_ORJSON else 0
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode("utf-8")
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class TTLCache:
+    """Thread-safe single-value cache that recomputes once ``ttl`` seconds have passed."""
+    
+    # Hit rate is checked over windows of this many lookups
+    HIT_RATE_WINDOW = 1000
+    LOW_HIT_RATE = 0.3
+    
+    def __init__(self, ttl: float, name: str = "cache"):
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_compute_ns = 0
+        self._window_hits = 0
+        self._window_lookups = 0
+        self._entry = None  # (expires_at, value)
+        self._lock = threading.Lock()
+    
+    def get(self, compute):
+        """Return the cached value, calling ``compute()`` if it is missing or stale.
+        
+        Concurrent callers wait for a single in-flight ``compute()`` instead of
+        each issuing their own.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._entry and self._entry[0] > now:
+                self.hits += 1
+                self._record_lookup(hit=True)
+                return self._entry[1]
+            
+            self.misses += 1
+            if self._entry:
+                self.evictions += 1
+            self._record_lookup(hit=False)
+            start_ns = time.perf_counter_ns()
+            value = compute()
+            self.total_compute_ns += time.perf_counter_ns() - start_ns
+            self._entry = (now + self.ttl, value)
+            return value
+    
+    def _record_lookup(self, hit: bool):
+        """Track the rolling hit rate and warn when the TTL looks too short to help."""
+        self._window_lookups += 1
+        self._window_hits += hit
+        if self._window_lookups >= self.HIT_RATE_WINDOW:
+            hit_rate = self._window_hits / self._window_lookups
+            if hit_rate < self.LOW_HIT_RATE:
+                logger.warning(
+                    f"{self.name} cache hit rate {hit_rate:.0%} over the last "
+                    f"{self._window_lookups} lookups; consider a longer TTL than {self.ttl}s"
+                )
+            self._window_hits = 0
+            self._window_lookups = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the mean time spent recomputing."""
+        with self._lock:
+            return {
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "avg_compute_ms": round(self.total_compute_ns / self.misses / 1e6, 3) if self.misses else 0.0
+            }
+
 
 class DashboardAPI:
     """Dashboard API service for managing analytics and metrics."""
     
     def __init__(self):
         self.app = Flask(__name__)
+        if _HAS_ORJSON:
+            self.app.json = ORJSONProvider(self.app)
         CORS(self.app)
         
         # Configuration
         self.chatbot_api_url = os.getenv("CHATBOT_API_URL", "http://localhost:8000")
         self.dashboard_port = int(os.getenv("DASHBOARD_PORT", "5000"))
+        self.stats_ttl_seconds = float(os.getenv("DASHBOARD_STATS_TTL", "5"))
+        self.health_ttl_seconds = float(os.getenv("DASHBOARD_HEALTH_TTL", "2"))
+        
+        # Reuse keep-alive connections to the chatbot API across requests
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=64,
+            max_retries=Retry(total=1, backoff_factor=0.1)
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        
+        # Stats and health are shared by every dashboard endpoint; fetch them once per TTL
+        self.stats_cache = TTLCache(self.stats_ttl_seconds, name="stats")
+        self.health_cache = TTLCache(self.health_ttl_seconds, name="health")
+        
+        # 7-day trends (labels included) for the current date: (date, payload)
+        self._trends_cache = None
+        
+        # Last /api/health timestamp: (unix second, ISO string)
+        self._health_timestamp = (None, None)
+        
+        # Worker threads for running independent metric probes concurrently
+        self.probe_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="probe")
         
         # Setup routes
         self.setup_routes()
@@ -64,13 +281,29 @@ class DashboardAPI:
     def setup_routes(self):
         """Setup Flask routes."""
         
+        @self.app.after_request
+        def add_etag(response):
+            """Tag JSON responses so unchanged polls get a bodiless 304."""
+            if (request.method in ("GET", "HEAD") and response.status_code == 200
+                    and response.mimetype == "application/json"):
+                # Browsers must revalidate, which sends If-None-Match
+                response.cache_control.no_cache = True
+                response.add_etag()
+                response.make_conditional(request)
+            return response
+        
         @self.app.route('/api/health', methods=['GET'])
         def health_check():
             """Dashboard health check endpoint."""
+            # Format the timestamp at most once per second of wall time
+            second = int(time.time())
+            if self._health_timestamp[0] != second:
+                self._health_timestamp = (second, datetime.utcnow().isoformat())
+            
             return jsonify({
                 "status": "healthy",
                 "message": "Dashboard Backend is running",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._health_timestamp[1],
                 "chatbot_api_url": self.chatbot_api_url
             })
         
@@ -78,7 +311,7 @@ class DashboardAPI:
         def chatbot_health():
             """Check main chatbot API health."""
             try:
-                response = requests.get(f"{self.chatbot_api_url}/health", timeout=5)
+                response = self.probe_chatbot("/health")
                 if response.status_code == 200:
                     return jsonify({
                         "status": "healthy",
@@ -102,156 +335,202 @@ class DashboardAPI:
         def get_kpis():
             """Get Key Performance Indicators."""
             try:
-                # Try to get real data from analytics
-                stats = self.get_analytics_stats()
-                
-                # Calculate KPIs from analytics data
-                kpis = {
-                    "total_users": self.calculate_total_users(stats),
-                    "total_messages": stats.get("total_messages", 0),
-                    "avg_conversation_length": stats.get("average_conversation_length", 0),
-                    "response_time_ms": stats.get("average_response_time_ms", 350),
-                    "satisfaction_rating": stats.get("user_satisfaction_rating", 4.1),
-                    "positive_sentiment_percentage": self.calculate_positive_sentiment_percentage(stats)
-                }
-                
-                return jsonify(kpis)
+                return jsonify(self.get_stats_views()["kpis"])
                 
             except Exception as e:
                 logger.error(f"Error getting KPIs: {e}")
                 # Return mock data if real data fails
-                return jsonify(self.get_mock_kpis())
+                return self.mock_response(MOCK_KPIS_JSON)
         
         @self.app.route('/api/conversation-trends', methods=['GET'])
         def get_conversation_trends():
             """Get conversation trends over the last 7 days."""
             try:
-                # Generate 7 days of data
-                labels = []
-                messages_data = []
-                conversations_data = []
-                
-                for i in range(7):
-                    date = datetime.now() - timedelta(days=6-i)
-                    labels.append(date.strftime("%m/%d"))
-                    
-                    # Get daily stats (mock for now, could be enhanced with real historical data)
-                    messages_data.append(self.get_daily_message_count(date))
-                    conversations_data.append(self.get_daily_conversation_count(date))
-                
-                return jsonify({
-                    "labels": labels,
-                    "messages": messages_data,
-                    "conversations": conversations_data
-                })
+                return jsonify(self.get_conversation_trends())
                 
             except Exception as e:
                 logger.error(f"Error getting conversation trends: {e}")
-                return jsonify(self.get_mock_conversation_trends())
+                return self.mock_response(MOCK_CONVERSATION_TRENDS_JSON)
         
         @self.app.route('/api/sentiment-distribution', methods=['GET'])
         def get_sentiment_distribution():
             """Get sentiment distribution data."""
             try:
-                stats = self.get_analytics_stats()
-                sentiment_dist = stats.get("sentiment_distribution", {})
-                
-                # Ensure all sentiment types are represented
-                total_messages = sum(sentiment_dist.values()) or 1
-                
-                return jsonify({
-                    "labels": ["Positive", "Negative", "Neutral"],
-                    "data": [
-                        sentiment_dist.get("positive", 0),
-                        sentiment_dist.get("negative", 0),
-                        sentiment_dist.get("neutral", 0)
-                    ],
-                    "percentages": [
-                        round(sentiment_dist.get("positive", 0) / total_messages * 100, 1),
-                        round(sentiment_dist.get("negative", 0) / total_messages * 100, 1),
-                        round(sentiment_dist.get("neutral", 0) / total_messages * 100, 1)
-                    ]
-                })
+                return jsonify(self.get_stats_views()["sentiment"])
                 
             except Exception as e:
                 logger.error(f"Error getting sentiment distribution: {e}")
-                return jsonify(self.get_mock_sentiment_distribution())
+                return self.mock_response(MOCK_SENTIMENT_DISTRIBUTION_JSON)
         
         @self.app.route('/api/intent-distribution', methods=['GET'])
         def get_intent_distribution():
             """Get intent distribution data."""
             try:
-                stats = self.get_analytics_stats()
-                intent_dist = stats.get("intent_distribution", {})
-                
-                # Convert to lists for chart display
-                labels = list(intent_dist.keys())
-                data = list(intent_dist.values())
-                
-                # Sort by frequency
-                sorted_items = sorted(zip(labels, data), key=lambda x: x[1], reverse=True)
-                labels, data = zip(*sorted_items) if sorted_items else ([], [])
-                
-                return jsonify({
-                    "labels": list(labels),
-                    "data": list(data)
-                })
+                top = self.parse_top(TOP_INTENTS)
+                return jsonify(self.top_items(self.get_stats_views()["intent"], top))
                 
             except Exception as e:
                 logger.error(f"Error getting intent distribution: {e}")
-                return jsonify(self.get_mock_intent_distribution())
+                return self.mock_response(MOCK_INTENT_DISTRIBUTION_JSON)
         
         @self.app.route('/api/platform-usage', methods=['GET'])
         def get_platform_usage():
             """Get platform usage statistics."""
             try:
-                stats = self.get_analytics_stats()
-                platform_dist = stats.get("platform_distribution", {})
-                
-                # Convert to chart format
-                labels = list(platform_dist.keys())
-                data = list(platform_dist.values())
-                
-                return jsonify({
-                    "labels": labels,
-                    "data": data
-                })
+                view = self.get_stats_views()["platform"]
+                if "top" in request.args:
+                    # Platforms keep their natural order unless a top-k is requested
+                    pairs = heapq.nlargest(self.parse_top(MAX_CHART_ITEMS), zip(view["labels"], view["data"]), key=itemgetter(1))
+                    view = {"labels": [label for label, _ in pairs], "data": [count for _, count in pairs]}
+                return jsonify(view)
                 
             except Exception as e:
                 logger.error(f"Error getting platform usage: {e}")
-                return jsonify(self.get_mock_platform_usage())
+                return self.mock_response(MOCK_PLATFORM_USAGE_JSON)
         
         @self.app.route('/api/real-time-metrics', methods=['GET'])
         def get_real_time_metrics():
             """Get real-time system metrics."""
             try:
-                # Check chatbot health
-                chatbot_healthy = self.is_chatbot_healthy()
+                return jsonify(self.collect_real_time_metrics())
+                
+            except Exception as e:
+                logger.error(f"Error getting real-time metrics: {e}")
+                return self.mock_response(MOCK_REAL_TIME_METRICS_JSON)
+        
+        @self.app.route('/api/dashboard', methods=['GET'])
+        def get_dashboard():
+            """Get every dashboard panel in one response, from a single stats fetch."""
+            try:
+                views = self.get_stats_views()
                 
                 return jsonify({
-                    "server_status": "healthy",
-                    "chatbot_status": "healthy" if chatbot_healthy else "unhealthy",
-                    "active_sessions": self.get_active_sessions_count(),
-                    "uptime_hours": self.get_uptime_hours(),
-                    "messages_per_minute": self.get_messages_per_minute(),
-                    "average_response_time": self.get_current_response_time()
+                    "kpis": views["kpis"],
+                    "conversation_trends": self.get_conversation_trends(),
+                    "sentiment_distribution": views["sentiment"],
+                    "intent_distribution": self.top_items(views["intent"], TOP_INTENTS),
+                    "platform_usage": views["platform"],
+                    "real_time_metrics": self.collect_real_time_metrics()
                 })
                 
             except Exception as e:
-                logger.error(f"Error getting real-time metrics: {e}")
-                return jsonify(self.get_mock_real_time_metrics())
+                logger.error(f"Error getting dashboard data: {e}")
+                return jsonify({
+                    "kpis": MOCK_KPIS,
+                    "conversation_trends": MOCK_CONVERSATION_TRENDS,
+                    "sentiment_distribution": MOCK_SENTIMENT_DISTRIBUTION,
+                    "intent_distribution": MOCK_INTENT_DISTRIBUTION,
+                    "platform_usage": MOCK_PLATFORM_USAGE,
+                    "real_time_metrics": MOCK_REAL_TIME_METRICS
+                })
+        
+        @self.app.route('/api/cache-stats', methods=['GET'])
+        def get_cache_stats():
+            """Get hit/miss counters for the TTL caches, for tuning their TTLs."""
+            return jsonify({
+                "stats": self.stats_cache.stats(),
+                "health": self.health_cache.stats()
+            })
+    
+    def collect_real_time_metrics(self) -> Dict[str, Any]:
+        """Run the real-time metric probes concurrently.
+        
+        Wall time is that of the slowest probe, capped at ``PROBE_TIMEOUT``;
+        probes that miss the deadline report their mock value instead.
+        """
+        probes = {
+            "chatbot_status": lambda: "healthy" if self.is_chatbot_healthy() else "unhealthy",
+            "active_sessions": self.get_active_sessions_count,
+            "uptime_hours": self.get_uptime_hours,
+            "messages_per_minute": self.get_messages_per_minute,
+            "average_response_time": self.get_current_response_time
+        }
+        futures = {field: self.probe_pool.submit(probe) for field, probe in probes.items()}
+        wait(futures.values(), timeout=PROBE_TIMEOUT)
+        
+        # A chatbot that cannot answer in time is not healthy
+        fallback = dict(self.get_mock_real_time_metrics(), chatbot_status="unhealthy")
+        metrics = {"server_status": "healthy"}
+        for field, future in futures.items():
+            if future.done() and future.exception() is None:
+                metrics[field] = future.result()
+            else:
+                logger.warning(f"Real-time metric probe '{field}' failed or timed out")
+                metrics[field] = fallback[field]
+        
+        return metrics
     
     def get_analytics_stats(self) -> Dict[str, Any]:
-        """Get analytics stats from the main chatbot API or in-memory analytics."""
+        """Get analytics stats, reusing a recent result for up to ``stats_ttl_seconds``."""
+        return self.stats_cache.get(self._fetch_stats_and_views)[0]
+    
+    def get_stats_views(self) -> Dict[str, Dict[str, Any]]:
+        """Get KPI and chart payloads derived from the cached analytics stats."""
+        return self.stats_cache.get(self._fetch_stats_and_views)[1]
+    
+    def _fetch_stats_and_views(self):
+        """Fetch fresh stats and build their chart views."""
+        stats = self.fetch_analytics_stats()
+        return stats, self.build_stats_views(stats)
+    
+    def build_stats_views(self, stats: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Build the KPI, sentiment, intent and platform payloads once per stats fetch."""
+        sentiment_data, sentiment_percentages = self.sentiment_breakdown(stats)
+        
+        # Most frequent intents first, then split into chart columns
+        intent_items = heapq.nlargest(MAX_CHART_ITEMS, stats.get("intent_distribution", {}).items(), key=itemgetter(1))
+        
+        platform_dist = stats.get("platform_distribution", {})
+        
+        return {
+            "kpis": {
+                "total_users": self.calculate_total_users(stats),
+                "total_messages": stats.get("total_messages", 0),
+                "avg_conversation_length": stats.get("average_conversation_length", 0),
+                "response_time_ms": stats.get("average_response_time_ms", 350),
+                "satisfaction_rating": stats.get("user_satisfaction_rating", 4.1),
+                "positive_sentiment_percentage": sentiment_percentages[0]
+            },
+            "sentiment": {
+                "labels": ["Positive", "Negative", "Neutral"],
+                "data": sentiment_data,
+                "percentages": sentiment_percentages
+            },
+            "intent": {
+                "labels": [intent for intent, _ in intent_items],
+                "data": [count for _, count in intent_items]
+            },
+            "platform": {
+                "labels": list(platform_dist.keys()),
+                "data": list(platform_dist.values())
+            }
+        }
+    
+    @cached_property
+    def analytics(self):
+        """Import the chatbot's in-memory analytics on first use; mock-only runs never load it."""
+        src_dir = str(project_root / "src")
+        if src_dir not in sys.path:
+            sys.path.insert(0, src_dir)
+        try:
+            from analytics import analytics
+        except ImportError as e:
+            logger.warning(f"Could not import main chatbot modules: {e}")
+            return None
+        return analytics
+    
+    def fetch_analytics_stats(self) -> Dict[str, Any]:
+        """Fetch analytics stats from the main chatbot API or in-memory analytics."""
         try:
             # Try to get from main chatbot API first
-            response = requests.get(f"{self.chatbot_api_url}/analytics/stats", timeout=5)
+            response = self.http.get(f"{self.chatbot_api_url}/analytics/stats", timeout=UPSTREAM_TIMEOUT)
             if response.status_code == 200:
                 return response.json()
         except requests.RequestException:
             logger.warning("Could not connect to main chatbot API for analytics")
         
         # Fallback to in-memory analytics if available
+        analytics = self.analytics
         if analytics:
             return analytics.get_stats()
         
@@ -274,19 +553,40 @@ class DashboardAPI:
         # Assume average user has 1.5 conversations
         return max(1, int(total_conversations / 1.5))
     
-    def calculate_positive_sentiment_percentage(self, stats: Dict[str, Any]) -> float:
-        """Calculate positive sentiment percentage."""
+    def parse_top(self, default: int) -> int:
+        """Read the ``?top=`` query parameter, clamped to 1..MAX_CHART_ITEMS."""
+        top = request.args.get("top", default, type=int)
+        return max(1, min(top, MAX_CHART_ITEMS))
+    
+    def top_items(self, view: Dict[str, List], top: int) -> Dict[str, List]:
+        """Trim an already frequency-sorted chart view to its first ``top`` entries."""
+        return {"labels": view["labels"][:top], "data": view["data"][:top]}
+    
+    def sentiment_breakdown(self, stats: Dict[str, Any]) -> Tuple[List[int], List[float]]:
+        """Get positive/negative/neutral counts and their percentages."""
+        # Ensure all sentiment types are represented
         sentiment_dist = stats.get("sentiment_distribution", {})
+        counts = [
+            sentiment_dist.get("positive", 0),
+            sentiment_dist.get("negative", 0),
+            sentiment_dist.get("neutral", 0)
+        ]
         total = sum(sentiment_dist.values())
-        if total == 0:
-            return 0.0
-        return round(sentiment_dist.get("positive", 0) / total * 100, 1)
+        scale = 100.0 / total if total else 0.0
+        return counts, [round(count * scale, 1) for count in counts]
     
     def is_chatbot_healthy(self) -> bool:
-        """Check if the main chatbot API is healthy."""
+        """Check if the main chatbot API is healthy, reusing a recent result."""
+        return self.health_cache.get(self.probe_chatbot_health)
+    
+    def probe_chatbot(self, path: str) -> requests.Response:
+        """Send a HEAD request to the chatbot API; liveness needs the status, not the body."""
+        return self.http.head(f"{self.chatbot_api_url}{path}", timeout=UPSTREAM_TIMEOUT)
+    
+    def probe_chatbot_health(self) -> bool:
+        """Probe the main chatbot API health endpoint."""
         try:
-            response = requests.get(f"{self.chatbot_api_url}/health", timeout=3)
-            return response.status_code == 200
+            return self.probe_chatbot("/health").status_code == 200
         except requests.RequestException:
             return False
     
@@ -310,90 +610,82 @@ class DashboardAPI:
         # In a real implementation, this would track recent response times
         return 285
     
-    def get_daily_message_count(self, date: datetime) -> int:
-        """Get message count for a specific day (mock implementation)."""
-        # In a real implementation, this would query historical data
-        import random
-        return random.randint(50, 200)
-    
-    def get_daily_conversation_count(self, date: datetime) -> int:
-        """Get conversation count for a specific day (mock implementation)."""
-        # In a real implementation, this would query historical data
-        import random
-        return random.randint(20, 80)
-    
-    # Mock data methods for fallback scenarios
-    def get_mock_kpis(self) -> Dict[str, Any]:
-        """Get mock KPI data for testing."""
-        return {
-            "total_users": 1247,
-            "total_messages": 8932,
-            "avg_conversation_length": 4.2,
-            "response_time_ms": 285,
-            "satisfaction_rating": 4.1,
-            "positive_sentiment_percentage": 68.5
-        }
-    
-    def get_mock_conversation_trends(self) -> Dict[str, List]:
-        """Get mock conversation trends data."""
-        return {
-            "labels": ["09/24", "09/25", "09/26", "09/27", "09/28", "09/29", "09/30"],
-            "messages": [120, 135, 98, 167, 143, 189, 156],
-            "conversations": [45, 52, 38, 63, 54, 71, 59]
-        }
-    
-    def get_mock_sentiment_distribution(self) -> Dict[str, Any]:
-        """Get mock sentiment distribution data."""
-        return {
-            "labels": ["Positive", "Negative", "Neutral"],
-            "data": [425, 89, 234],
-            "percentages": [56.8, 11.9, 31.3]
-        }
+    def get_conversation_trends(self) -> Dict[str, List]:
+        """Get the 7-day conversation trends, rebuilt when the date rolls over."""
+        now = datetime.now()
+        if self._trends_cache is None or self._trends_cache[0] != now.date():
+            self._trends_cache = (now.date(), self.build_conversation_trends(now))
+        return self._trends_cache[1]
     
-    def get_mock_intent_distribution(self) -> Dict[str, List]:
-        """Get mock intent distribution data."""
+    def build_conversation_trends(self, now: datetime) -> Dict[str, List]:
+        """Build the 7-day conversation trends ending at ``now``."""
+        dates = [now - timedelta(days=6 - i) for i in range(7)]
+        counts = self.get_daily_counts(dates[0], dates[-1])
+        
         return {
-            "labels": ["question", "greeting", "help", "request", "goodbye", "complaint"],
-            "data": [342, 189, 156, 98, 87, 45]
+            "labels": [date.strftime("%m/%d") for date in dates],
+            "messages": [messages for messages, _ in counts],
+            "conversations": [conversations for _, conversations in counts]
         }
     
-    def get_mock_platform_usage(self) -> Dict[str, List]:
-        """Get mock platform usage data."""
-        return {
-            "labels": ["Web", "API", "Slack", "Telegram"],
-            "data": [456, 234, 123, 89]
-        }
+    def get_daily_counts(self, start: datetime, end: datetime) -> List[Tuple[int, int]]:
+        """Get ``(messages, conversations)`` for each day from ``start`` to ``end`` (mock implementation)."""
+        # In a real implementation, this would be one ranged query against historical data
+        days = (end.date() - start.date()).days + 1
+        return [(_rng.randint(50, 200), _rng.randint(20, 80)) for _ in range(days)]
     
+    # Mock data methods for fallback scenarios
     def get_mock_real_time_metrics(self) -> Dict[str, Any]:
         """Get mock real-time metrics data."""
-        return {
-            "server_status": "healthy",
-            "chatbot_status": "healthy",
-            "active_sessions": 15,
-            "uptime_hours": 24.5,
-            "messages_per_minute": 8,
-            "average_response_time": 285
-        }
+        return MOCK_REAL_TIME_METRICS
+    
+    def mock_response(self, body: bytes) -> Response:
+        """Serve a pre-encoded mock JSON body with its precomputed ETag."""
+        response = Response(body, mimetype="application/json")
+        response.set_etag(MOCK_ETAGS[body])
+        return response
     
     def run(self, debug=False):
         """Run the Flask application."""
-        # Ensure logs directory exists
-        logs_dir = Path(__file__).parent.parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-        
         logger.info(f"Starting Dashboard Backend on port {self.dashboard_port}")
         logger.info(f"Chatbot API URL: {self.chatbot_api_url}")
         
         try:
-            self.app.run(
-                host='0.0.0.0',
-                port=self.dashboard_port,
-                debug=debug,
-                threaded=True
-            )
+            if USE_GUNICORN and not debug:
+                self.run_gunicorn()
+            else:
+                self.app.run(
+                    host='0.0.0.0',
+                    port=self.dashboard_port,
+                    debug=debug,
+                    threaded=True
+                )
         except Exception as e:
             logger.error(f"Failed to start Dashboard Backend: {e}")
             raise
+    
+    def run_gunicorn(self):
+        """Serve the app with gunicorn gevent workers instead of the Flask dev server."""
+        from gunicorn.app.base import BaseApplication
+        
+        flask_app = self.app
+        options = {
+            "bind": f"0.0.0.0:{self.dashboard_port}",
+            "workers": int(os.getenv("DASHBOARD_WORKERS", "2")),
+            "worker_class": "gevent",
+            "worker_connections": 1000
+        }
+        
+        class DashboardServer(BaseApplication):
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+            
+            def load(self):
+                return flask_app
+        
+        logger.info(f"Serving with gunicorn ({options['workers']} gevent workers)")
+        DashboardServer().run()
 
 
 def main():
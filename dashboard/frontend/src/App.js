@@ -41,28 +41,15 @@ const App = () => {
       setLoading(true);
       setError(null);
 
-      const [
-        kpiData,
-        trendsData,
-        sentimentDistribution,
-        intentDistribution,
-        platformUsage,
-        realTimeData
-      ] = await Promise.all([
-        apiClient.get('/api/kpis'),
-        apiClient.get('/api/conversation-trends'),
-        apiClient.get('/api/sentiment-distribution'),
-        apiClient.get('/api/intent-distribution'),
-        apiClient.get('/api/platform-usage'),
-        apiClient.get('/api/real-time-metrics')
-      ]);
+      // One request for every panel; the backend reads analytics stats once
+      const dashboard = await apiClient.get('/api/dashboard');
 
-      setKpis(kpiData);
-      setConversationTrends(trendsData);
-      setSentimentData(sentimentDistribution);
-      setIntentData(intentDistribution);
-      setPlatformData(platformUsage);
-      setRealTimeMetrics(realTimeData);
+      setKpis(dashboard.kpis);
+      setConversationTrends(dashboard.conversation_trends);
+      setSentimentData(dashboard.sentiment_distribution);
+      setIntentData(dashboard.intent_distribution);
+      setPlatformData(dashboard.platform_usage);
+      setRealTimeMetrics(dashboard.real_time_metrics);
       setLastUpdated(new Date());
     } catch (err) {
       setError('Failed to fetch dashboard data');
@@ -1,41 +1,108 @@
 #!/usr/bin/env python3
 """
 Deployment automation script for Dynamic AI Chatbot
-Usage: python deploy.py [platform]
+Usage: python deploy.py [platform] [--local-build]
 Platforms: vercel, railway, render, docker
 """
 
 import os
 import sys
+import shlex
+import shutil
 import subprocess
 import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run shell command and return result"""
+# Tool versions rarely change between deploys, so probes are cached per executable
+PREREQ_CACHE_FILE = Path.home() / ".cache" / "dynamic_ai_chatbot" / "prereqs.json"
+PREREQ_CACHE_TTL = 3600
+
+def run_command(cmd, cwd=None, shell=False, stream=False):
+    """Run a command and return its output; only pass shell=True for pipelines
+
+    With stream=True the command writes straight to the terminal, which suits
+    long builds, and True is returned on success instead of the output.
+    """
+    args = cmd if shell or isinstance(cmd, list) else shlex.split(cmd)
+    if not shell:
+        # Resolve .cmd shims such as npm and vercel, which Windows cannot exec without a shell
+        args = [which(args[0]) or args[0]] + list(args[1:])
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, 
+        if stream:
+            subprocess.run(args, shell=shell, cwd=cwd, check=True)
+            return True
+        result = subprocess.run(args, shell=shell, cwd=cwd, 
                               capture_output=True, text=True, check=True)
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         print(f"❌ Command failed: {cmd}")
-        print(f"Error: {e.stderr}")
+        if e.stderr:
+            print(f"Error: {e.stderr}")
+        return None
+    except FileNotFoundError:
+        # Without a shell, a missing executable raises instead of exiting 127
+        print(f"❌ Command not found: {args[0]}")
         return None
 
+def load_prereq_cache():
+    """Load cached tool versions, or an empty cache if there is none"""
+    try:
+        with open(PREREQ_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_prereq_cache(cache):
+    """Persist cached tool versions; failing to write only costs a re-probe"""
+    try:
+        PREREQ_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(PREREQ_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+@lru_cache(maxsize=None)
+def which(name):
+    """Look up a CLI on PATH once per deploy.py run"""
+    return shutil.which(name)
+
+def tool_version(name, cache):
+    """Return ``name --version`` output, or None if the tool is not on PATH"""
+    path = which(name)
+    if not path:
+        return None
+    
+    # Key on path and mtime so upgrading the tool invalidates its entry
+    key = f"{path}:{os.stat(path).st_mtime_ns}"
+    entry = cache.get(key)
+    if entry and time.time() - entry["checked_at"] < PREREQ_CACHE_TTL:
+        return entry["version"]
+    
+    version = run_command([path, "--version"])
+    if version:
+        cache[key] = {"version": version, "checked_at": time.time()}
+    return version
+
 def check_prerequisites():
     """Check if required tools are installed"""
     print("🔍 Checking prerequisites...")
     
-    # Check Python
-    python_version = run_command("python --version")
-    if python_version:
-        print(f"✅ {python_version}")
-    else:
-        print("❌ Python not found")
-        return False
+    # Check Python (this interpreter; no need to spawn another one)
+    print(f"✅ Python {sys.version.split()[0]}")
+    
+    # Only spawn version probes for tools that are on PATH and not cached, and run them together
+    cache = load_prereq_cache()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        node_version, docker_version = executor.map(
+            lambda name: tool_version(name, cache), ["node", "docker"]
+        )
+    save_prereq_cache(cache)
     
     # Check Node.js
-    node_version = run_command("node --version")
     if node_version:
         print(f"✅ Node.js {node_version}")
     else:
@@ -43,7 +110,6 @@ def check_prerequisites():
         return False
     
     # Check Docker
-    docker_version = run_command("docker --version")
     if docker_version:
         print(f"✅ {docker_version}")
     else:
@@ -60,39 +126,47 @@ def build_frontend():
         print("❌ Frontend directory not found")
         return False
     
-    # Install dependencies
-    print("📥 Installing frontend dependencies...")
-    if not run_command("npm install", cwd=frontend_path):
-        return False
+    # Install dependencies, unless node_modules was installed from the same manifest
+    lockfile = frontend_path / "package-lock.json"
+    manifest = lockfile if lockfile.exists() else frontend_path / "package.json"
+    manifest_hash = hashlib.sha256(manifest.read_bytes()).hexdigest()
+    marker = frontend_path / "node_modules" / ".install-hash"
+    if marker.exists() and marker.read_text() == manifest_hash:
+        print("✅ Frontend dependencies up to date, skipping install")
+    else:
+        print("📥 Installing frontend dependencies...")
+        # npm ci installs straight from the lockfile without re-resolving the tree
+        if not run_command("npm ci" if lockfile.exists() else "npm install", cwd=frontend_path, stream=True):
+            return False
+        marker.write_text(manifest_hash)
     
     # Build
     print("🔨 Building frontend...")
-    if not run_command("npm run build", cwd=frontend_path):
+    if not run_command("npm run build", cwd=frontend_path, stream=True):
         return False
     
     print("✅ Frontend built successfully")
     return True
 
-def deploy_to_vercel():
+def deploy_to_vercel(local_build=False):
     """Deploy to Vercel"""
     print("🚀 Deploying to Vercel...")
     
     # Check if Vercel CLI is installed
-    if not run_command("vercel --version"):
+    if not which("vercel"):
         print("📥 Installing Vercel CLI...")
         if not run_command("npm install -g vercel"):
             print("❌ Failed to install Vercel CLI")
             return False
     
-    # Build frontend first
-    if not build_frontend():
+    # Vercel builds from source on its side; a local build is only a preflight check
+    if local_build and not build_frontend():
         return False
     
     # Deploy
     print("🚀 Deploying to Vercel...")
-    result = run_command("vercel --prod --yes")
-    if result:
-        print(f"✅ Deployed to Vercel: {result}")
+    if run_command("vercel --prod --yes", stream=True):
+        print("✅ Deployed to Vercel")
         return True
     else:
         print("❌ Vercel deployment failed")
@@ -103,10 +177,10 @@ def deploy_to_railway():
     print("🚀 Deploying to Railway...")
     
     # Check if Railway CLI is installed
-    if not run_command("railway version"):
+    if not which("railway"):
         print("📥 Installing Railway CLI...")
         install_cmd = "curl -sSL https://railway.app/install.sh | sh"
-        if not run_command(install_cmd):
+        if not run_command(install_cmd, shell=True):
             print("❌ Failed to install Railway CLI")
             return False
     
@@ -135,24 +209,24 @@ def build_docker():
     """Build Docker image"""
     print("🐳 Building Docker image...")
     
-    # Build production image
-    cmd = "docker build -f Dockerfile.production -t dynamic-ai-chatbot:latest ."
-    if run_command(cmd):
+    # Ask up front so the build itself can tag and push
+    push = input("🤔 Push to GitHub Container Registry? (y/N): ").lower() == 'y'
+    repo_name = "ghcr.io/neslang-05/dynamic_ai_chatbot:latest"
+    
+    # Build production image; BuildKit tags and pushes in the same invocation
+    cmd = [
+        "docker", "buildx", "build", "-f", "Dockerfile.production",
+        "--cache-from", f"type=registry,ref={repo_name}",
+    ]
+    if push:
+        # --push pushes every tag, so only the registry-qualified one is given
+        cmd += ["--tag", repo_name, "--cache-to", "type=inline", "--push"]
+    else:
+        cmd += ["--tag", "dynamic-ai-chatbot:latest", "--load"]
+    if run_command(cmd + ["."], stream=True):
         print("✅ Docker image built successfully")
-        
-        # Optionally push to registry
-        push = input("🤔 Push to GitHub Container Registry? (y/N): ")
-        if push.lower() == 'y':
-            # Tag and push
-            repo_name = "ghcr.io/neslang-05/dynamic_ai_chatbot:latest"
-            if run_command(f"docker tag dynamic-ai-chatbot:latest {repo_name}"):
-                if run_command(f"docker push {repo_name}"):
-                    print(f"✅ Pushed to {repo_name}")
-                else:
-                    print("❌ Failed to push image")
-            else:
-                print("❌ Failed to tag image")
-        
+        if push:
+            print(f"✅ Pushed to {repo_name}")
         return True
     else:
         print("❌ Docker build failed")
@@ -201,6 +275,8 @@ def main():
         print("  render   - Deploy to Render")
         print("  docker   - Build Docker image")
         print("  env      - Create environment file")
+        print("\nOptions:")
+        print("  --local-build  Build the frontend locally before a Vercel deploy")
         print("\nExample: python deploy.py vercel")
         return
     
@@ -217,7 +293,7 @@ def main():
     success = False
     
     if platform == "vercel":
-        success = deploy_to_vercel()
+        success = deploy_to_vercel(local_build="--local-build" in sys.argv[2:])
     elif platform == "railway":
         success = deploy_to_railway()
     elif platform == "render":
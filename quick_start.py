@@ -7,20 +7,38 @@ A simple version that starts services with minimal checks for fast development
 import os
 import sys
 import time
+import shlex
+import shutil
+import signal
+import socket
 import subprocess
 import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_command_async(name, command, cwd=None, env=None):
     """Run a command asynchronously and return the process."""
     print(f"🚀 Starting {name}...")
+    windows = sys.platform == "win32"
+    shell = False
+    if isinstance(command, str):
+        # Only a string command on Windows needs cmd.exe; elsewhere it is split into argv
+        shell = windows
+        if not windows:
+            command = shlex.split(command)
+    elif windows:
+        # Resolve npm.cmd and friends without going through cmd.exe
+        command = [shutil.which(command[0]) or command[0]] + list(command[1:])
     try:
         process = subprocess.Popen(
             command,
             cwd=cwd,
             env=env,
-            shell=True if sys.platform == "win32" else False
+            shell=shell,
+            # Own session and process group, so stop_all can signal the whole service tree
+            start_new_session=not windows
         )
         print(f"  ✅ {name} started (PID: {process.pid})")
         return process
@@ -29,14 +47,38 @@ def run_command_async(name, command, cwd=None, env=None):
         return None
 
 
-def main():
-    """Quick start all services."""
-    project_root = Path(__file__).parent
-    
-    print("⚡ Quick Starting Dynamic AI Chatbot Services...")
-    print("=" * 50)
-    
-    # Set up environment for Python virtual environment
+def wait_port(name, host, port, timeout=30):
+    """Poll until a TCP port accepts connections instead of sleeping blindly."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), 0.2).close()
+            print(f"  ✅ {name} is ready")
+            return True
+        except OSError:
+            time.sleep(0.1)
+    print(f"  ⚠️  {name} not ready after {timeout}s, continuing anyway")
+    return False
+
+
+def wait_http(name, url, timeout=30):
+    """Poll until an HTTP endpoint answers 200."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    print(f"  ✅ {name} is ready")
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.1)
+    print(f"  ⚠️  {name} not ready after {timeout}s, continuing anyway")
+    return False
+
+
+def service_env(project_root):
+    """Return the environment and Python executable to run services with, preferring ./venv."""
     env = os.environ.copy()
     venv_path = project_root / "venv"
     if venv_path.exists():
@@ -48,52 +90,97 @@ def main():
             python_cmd = str(venv_path / "bin" / "python")
     else:
         python_cmd = sys.executable
+    return env, python_cmd
+
+
+def start_all(project_root, processes):
+    """Start databases, the chatbot API and the dashboard, waiting on each dependency.
     
-    processes = []
+    Started services are appended to ``processes`` as they come up, so a caller
+    interrupted part-way through can still stop whatever is already running.
+    """
+    env, python_cmd = service_env(project_root)
     
-    try:
-        # 1. Start Docker services (Redis & MongoDB)
-        print("\n1️⃣  Starting Database Services...")
-        docker_process = run_command_async(
-            "Redis & MongoDB",
-            ["docker-compose", "up", "redis", "mongodb", "-d"],
-            cwd=project_root
-        )
-        time.sleep(8)  # Wait for databases to be ready
-        
-        # 2. Start Chatbot API
-        print("\n2️⃣  Starting Chatbot API...")
-        chatbot_process = run_command_async(
-            "Chatbot API",
-            [python_cmd, "src/main.py"],
-            cwd=project_root,
-            env=env
-        )
-        if chatbot_process:
-            processes.append(("Chatbot API", chatbot_process))
-        time.sleep(10)  # Wait for API to start
-        
-        # 3. Start Dashboard Backend
-        print("\n3️⃣  Starting Dashboard Backend...")
-        backend_process = run_command_async(
+    # 1. Start Docker services (Redis & MongoDB)
+    print("\n1️⃣  Starting Database Services...")
+    run_command_async(
+        "Redis & MongoDB",
+        ["docker-compose", "up", "redis", "mongodb", "-d"],
+        cwd=project_root
+    )
+    # The two databases come up independently, so wait on both at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(wait_port, ["MongoDB", "Redis"], ["localhost"] * 2, [27017, 6379]))
+    
+    # 2. Start Chatbot API
+    print("\n2️⃣  Starting Chatbot API...")
+    chatbot_process = run_command_async(
+        "Chatbot API",
+        [python_cmd, "src/main.py"],
+        cwd=project_root,
+        env=env
+    )
+    if chatbot_process:
+        processes.append(("Chatbot API", chatbot_process))
+    wait_http("Chatbot API", "http://localhost:8000/health")
+    
+    # 3. Start Dashboard Backend and Frontend; both only depend on the API
+    print("\n3️⃣  Starting Dashboard Backend & Frontend...")
+    
+    def start_backend():
+        process = run_command_async(
             "Dashboard Backend",
             [python_cmd, "app.py"],
             cwd=project_root / "dashboard" / "backend",
             env=env
         )
-        if backend_process:
-            processes.append(("Dashboard Backend", backend_process))
-        time.sleep(5)  # Wait for backend to start
-        
-        # 4. Start Dashboard Frontend
-        print("\n4️⃣  Starting Dashboard Frontend...")
-        frontend_process = run_command_async(
+        if process:
+            wait_port("Dashboard Backend", "localhost", 5000)
+        return "Dashboard Backend", process
+    
+    def start_frontend():
+        process = run_command_async(
             "Dashboard Frontend",
             ["npm", "start"],
             cwd=project_root / "dashboard" / "frontend"
         )
-        if frontend_process:
-            processes.append(("Dashboard Frontend", frontend_process))
+        return "Dashboard Frontend", process
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(start_backend), executor.submit(start_frontend)]
+        for future in futures:
+            name, process = future.result()
+            if process:
+                processes.append((name, process))
+    return processes
+
+
+def stop_all(processes):
+    """Terminate every started service, including the children it spawned."""
+    for name, process in processes:
+        try:
+            if os.name == "nt":
+                process.terminate()
+            else:
+                # Each service leads its own session; signal the whole group so
+                # grandchildren such as the dev server under `npm start` exit too
+                os.killpg(process.pid, signal.SIGTERM)
+            print(f"  🛑 Stopped {name}")
+        except (OSError, ProcessLookupError):
+            pass
+
+
+def main():
+    """Quick start all services."""
+    project_root = Path(__file__).parent
+    
+    print("⚡ Quick Starting Dynamic AI Chatbot Services...")
+    print("=" * 50)
+    
+    processes = []
+    
+    try:
+        start_all(project_root, processes)
         
         print("\n🎉 All services started!")
         print("\n📊 Access your application:")
@@ -113,12 +200,7 @@ def main():
         
     except KeyboardInterrupt:
         print("\n🛑 Stopping services...")
-        for name, process in processes:
-            try:
-                process.terminate()
-                print(f"  🛑 Stopped {name}")
-            except:
-                pass
+        stop_all(processes)
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -5,6 +5,10 @@ Provides convenient commands to start, test, and manage the chatbot.
 """
 import os
 import sys
+import json
+import http.client
+import time
+import shutil
 import argparse
 import subprocess
 from pathlib import Path
@@ -45,31 +49,30 @@ def run_tests():
     print("🧪 Running tests...")
     print("-" * 50)
     
-    test_commands = [
-        ["python", "-m", "pytest", "tests/", "-v"],
-        ["python", "test_basic.py"]
-    ]
-    
-    for cmd in test_commands:
-        try:
-            result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ {' '.join(cmd)} - PASSED")
-                if result.stdout:
-                    print(result.stdout)
-            else:
-                print(f"❌ {' '.join(cmd)} - FAILED")
-                if result.stderr:
-                    print(result.stderr)
-        except FileNotFoundError:
-            print(f"⚠️  {cmd[0]} not found, skipping {' '.join(cmd)}")
+    # One pytest run covers both, so startup and plugin discovery are paid once
+    cmd = [sys.executable, "-m", "pytest", "tests/", "test_basic.py", "-v", "-p", "no:cacheprovider"]
+    result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
+    if result.returncode == 0:
+        print(f"✅ {' '.join(cmd)} - PASSED")
+        if result.stdout:
+            print(result.stdout)
+    else:
+        print(f"❌ {' '.join(cmd)} - FAILED")
+        print(result.stdout + result.stderr)
 
 
-def install_dependencies(minimal=False):
+def install_dependencies(minimal=False, use_uv=True):
     """Install project dependencies."""
     print("📦 Installing dependencies...")
     print("-" * 50)
     
+    # uv resolves and downloads in parallel; otherwise prefer wheels over sdist builds
+    if use_uv and shutil.which("uv"):
+        installer = ["uv", "pip", "install", "--python", sys.executable]
+        print("Using uv for installation")
+    else:
+        installer = ["pip", "install", "--prefer-binary"]
+    
     if minimal:
         # Install only essential packages for basic functionality
         essential_packages = [
@@ -82,11 +85,11 @@ def install_dependencies(minimal=False):
             "python-dotenv"
         ]
         
-        cmd = ["pip", "install"] + essential_packages
+        cmd = installer + essential_packages
         print(f"Installing minimal dependencies: {', '.join(essential_packages)}")
     else:
         # Install from requirements.txt
-        cmd = ["pip", "install", "-r", "requirements.txt"]
+        cmd = installer + ["-r", "requirements.txt"]
         print("Installing from requirements.txt...")
     
     try:
@@ -101,34 +104,31 @@ def install_dependencies(minimal=False):
         sys.exit(1)
 
 
-def check_health(host="localhost", port=8000):
-    """Check if the server is running."""
+def check_health(host="localhost", port=8000, watch=1, interval=1.0):
+    """Check if the server is running, probing ``watch`` times over one keep-alive connection."""
     print("🏥 Checking server health...")
     print("-" * 50)
     
+    conn = http.client.HTTPConnection(host, port, timeout=5)
     try:
-        import requests
-        response = requests.get(f"http://{host}:{port}/health", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Server is healthy: {data.get('message', 'OK')}")
-        else:
-            print(f"⚠️  Server responded with status: {response.status_code}")
-    except ImportError:
-        print("⚠️  requests library not installed, using curl instead...")
-        try:
-            result = subprocess.run(
-                ["curl", "-s", f"http://{host}:{port}/health"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                print(f"✅ Server is healthy: {result.stdout}")
-            else:
-                print("❌ Server is not responding")
-        except Exception as e:
-            print(f"❌ Cannot check health: {e}")
-    except Exception as e:
-        print(f"❌ Server is not reachable: {e}")
+        for attempt in range(watch):
+            if attempt:
+                time.sleep(interval)
+            try:
+                conn.request("GET", "/health")
+                response = conn.getresponse()
+                body = response.read()
+                if response.status == 200:
+                    data = json.loads(body)
+                    print(f"✅ Server is healthy: {data.get('message', 'OK')}")
+                else:
+                    print(f"⚠️  Server responded with status: {response.status}")
+            except Exception as e:
+                # Drop the broken socket; the next request reconnects
+                conn.close()
+                print(f"❌ Server is not reachable: {e}")
+    finally:
+        conn.close()
 
 
 def show_info():
@@ -165,6 +165,17 @@ def show_info():
     print("  • TELEGRAM_BOT_TOKEN=your_token")
 
 
+def exec_service(cmd, cwd):
+    """Replace the runner with a long-running service; falls back to a child on Windows."""
+    sys.stdout.flush()
+    if sys.platform == "win32":
+        # Windows has no real exec, and npm needs its .cmd shim resolved
+        subprocess.run([shutil.which(cmd[0]) or cmd[0]] + cmd[1:], cwd=cwd)
+        return
+    os.chdir(cwd)
+    os.execvp(cmd[0], cmd)
+
+
 def start_dashboard_backend():
     """Start the dashboard backend server."""
     print("📊 Starting Dashboard Backend...")
@@ -176,7 +187,7 @@ def start_dashboard_backend():
         sys.exit(1)
     
     try:
-        subprocess.run(["python", "app.py"], cwd=dashboard_backend_path)
+        exec_service([sys.executable, "app.py"], dashboard_backend_path)
     except KeyboardInterrupt:
         print("\n🛑 Dashboard backend stopped by user")
     except Exception as e:
@@ -195,7 +206,7 @@ def start_dashboard_frontend():
         sys.exit(1)
     
     try:
-        subprocess.run(["npm", "start"], cwd=dashboard_frontend_path)
+        exec_service(["npm", "start"], dashboard_frontend_path)
     except KeyboardInterrupt:
         print("\n🛑 Dashboard frontend stopped by user")
     except Exception as e:
@@ -204,22 +215,31 @@ def start_dashboard_frontend():
 
 
 def start_all_services():
-    """Start all services (chatbot + dashboard) using the start_all.sh script."""
+    """Start all services (chatbot + dashboard) and stop them together on Ctrl+C."""
     print("🚀 Starting All Services...")
     print("-" * 50)
     
-    start_script = project_root / "start_all.sh"
-    if not start_script.exists():
-        print("❌ start_all.sh script not found!")
-        sys.exit(1)
+    from quick_start import start_all, stop_all
     
+    processes = []
     try:
-        subprocess.run(["bash", str(start_script)], cwd=project_root)
+        start_all(project_root, processes)
+        print("\n✅ All services started. Press Ctrl+C to stop all services")
+        
+        # Monitor the children directly; no shell layer sits between us and them
+        while True:
+            stopped = [name for name, process in processes if process.poll() is not None]
+            if stopped:
+                print(f"❌ {', '.join(stopped)} stopped unexpectedly!")
+                break
+            time.sleep(1)
     except KeyboardInterrupt:
         print("\n🛑 All services stopped by user")
     except Exception as e:
         print(f"❌ Error starting all services: {e}")
         sys.exit(1)
+    finally:
+        stop_all(processes)
 
 
 def setup_dashboard():
@@ -259,8 +279,38 @@ def docker_run():
         sys.exit(1)
 
 
+# Subcommand dispatch table; also the argparse choices
+COMMANDS = {
+    "test": lambda args: run_tests(),
+    "install": lambda args: install_dependencies(minimal=args.minimal, use_uv=args.use_uv),
+    "health": lambda args: check_health(args.host, args.port, args.watch, args.interval),
+    "info": lambda args: show_info(),
+    "docker": lambda args: docker_run(),
+    "dashboard-setup": lambda args: setup_dashboard(),
+    "dashboard-backend": lambda args: start_dashboard_backend(),
+    "dashboard-frontend": lambda args: start_dashboard_frontend(),
+    "all": lambda args: start_all_services(),
+}
+
+DEFAULT_ARGS = {
+    "host": "0.0.0.0",
+    "port": 8000,
+    "reload": False,
+    "log_level": "info",
+    "minimal": False,
+    "use_uv": True,
+    "watch": 1,
+    "interval": 1.0,
+}
+
+
 def main():
     """Main runner function."""
+    # A bare subcommand needs no option parsing, so skip building the parser
+    if len(sys.argv) == 2 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](argparse.Namespace(command=sys.argv[1], **DEFAULT_ARGS))
+        return
+    
     parser = argparse.ArgumentParser(
         description="Dynamic AI Chatbot Runner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -273,6 +323,7 @@ Examples:
   python runner.py install                  # Install dependencies
   python runner.py install --minimal       # Install minimal dependencies
   python runner.py health                   # Check server health
+  python runner.py health --watch 10       # Probe health 10 times over one connection
   python runner.py info                     # Show project information
   python runner.py docker                   # Run with Docker Compose
   python runner.py dashboard-setup          # Set up dashboard components
@@ -285,37 +336,29 @@ Examples:
     parser.add_argument(
         "command", 
         nargs="?", 
-        choices=["test", "install", "health", "info", "docker", "dashboard-setup", "dashboard-backend", "dashboard-frontend", "all"],
+        choices=list(COMMANDS),
         help="Command to execute"
     )
-    parser.add_argument("--host", default="0.0.0.0", help="Server host (default: 0.0.0.0)")
-    parser.add_argument("--port", type=int, default=8000, help="Server port (default: 8000)")
+    parser.add_argument("--host", default=DEFAULT_ARGS["host"], help="Server host (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=DEFAULT_ARGS["port"], help="Server port (default: 8000)")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
     parser.add_argument("--log-level", choices=["debug", "info", "warning", "error"], 
-                       default="info", help="Log level (default: info)")
+                       default=DEFAULT_ARGS["log_level"], help="Log level (default: info)")
     parser.add_argument("--minimal", action="store_true", 
                        help="Install only minimal dependencies (use with install command)")
+    parser.add_argument("--use-uv", dest="use_uv", action="store_true", default=True,
+                       help="Install with uv when it is on PATH (default; use with install command)")
+    parser.add_argument("--no-uv", dest="use_uv", action="store_false",
+                       help="Install with pip even if uv is available")
+    parser.add_argument("--watch", type=int, default=DEFAULT_ARGS["watch"],
+                       help="Number of health probes to send over one connection (use with health command)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_ARGS["interval"],
+                       help="Seconds between health probes (default: 1.0)")
     
     args = parser.parse_args()
     
-    if args.command == "test":
-        run_tests()
-    elif args.command == "install":
-        install_dependencies(minimal=args.minimal)
-    elif args.command == "health":
-        check_health(args.host, args.port)
-    elif args.command == "info":
-        show_info()
-    elif args.command == "docker":
-        docker_run()
-    elif args.command == "dashboard-setup":
-        setup_dashboard()
-    elif args.command == "dashboard-backend":
-        start_dashboard_backend()
-    elif args.command == "dashboard-frontend":
-        start_dashboard_frontend()
-    elif args.command == "all":
-        start_all_services()
+    if args.command in COMMANDS:
+        COMMANDS[args.command](args)
     else:
         # Default: run the server
         run_server(args.host, args.port, args.reload, args.log_level)
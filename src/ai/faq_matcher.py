@@ -0,0 +1,42 @@
+"""
+Single-pass keyword matching for FAQ lookups.
+"""
+import re
+from typing import Dict, Optional
+
+
+class FAQMatcher:
+    """Finds the first FAQ whose question keywords occur in a message.
+
+    Every keyword of every question goes into one lookahead alternation, so a
+    single scan of the message reports all keyword occurrences, including
+    overlapping ones. A question matches when at least ``min_fraction`` of its
+    keywords are present as substrings of the lowercased message.
+    """
+
+    def __init__(self, faqs: Dict[str, str], min_fraction: float = 1.0):
+        self.min_fraction = min_fraction
+        self._entries = [(frozenset(question.lower().split()), answer) for question, answer in faqs.items()]
+
+        keywords = set().union(*(entry_keywords for entry_keywords, _ in self._entries))
+        # Longest first, so the alternation reports the longest keyword at each
+        # position; the shorter ones starting there are exactly its prefixes
+        self._pattern = re.compile(
+            "(?=(" + "|".join(map(re.escape, sorted(keywords, key=len, reverse=True))) + "))"
+        )
+        self._found_with = {
+            keyword: frozenset(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the answer for the first matching FAQ, or None."""
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._found_with[match.group(1)]
+
+        for keywords, answer in self._entries:
+            if len(keywords & found) >= len(keywords) * self.min_fraction:
+                return answer
+
+        return None
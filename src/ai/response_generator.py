@@ -1,45 +1,169 @@
 """
 Hybrid response generation system combining rule-based and AI models.
 """
-import random
-from typing import List, Dict, Any, Optional
-from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import cycle
+from typing import List, Dict, Optional, Sequence, Tuple
+from transformers import (
+    pipeline, AutoTokenizer, AutoModelForCausalLM, StoppingCriteria, StoppingCriteriaList
+)
 import torch
 
 from models import Message, ConversationTurn, IntentType, SentimentType, EmotionType
 from config import settings
 from utils.logger import setup_logger
+from ai.faq_matcher import FAQMatcher
+from ai.semantic_cache import SemanticCache, load_sentence_encoder
+from utils.batching import MicroBatcher
 
 logger = setup_logger(__name__)
 
+# Tone adjustments keyed by (sentiment, emotion); (sentiment, None) is the fallback
+PERSONALIZATION_PREFIXES = {
+    (SentimentType.NEGATIVE, EmotionType.ANGER): "I understand you're feeling frustrated. ",
+    (SentimentType.NEGATIVE, EmotionType.SADNESS): "I'm sorry you're feeling down. ",
+    (SentimentType.NEGATIVE, None): "I sense you might be having a difficult time. ",
+    (SentimentType.POSITIVE, EmotionType.JOY): "I'm glad you're in good spirits! ",
+    (SentimentType.POSITIVE, None): "I'm happy to help! ",
+}
+
+_pipeline_lock = threading.Lock()
+_model_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+
+def _generative_dtype(use_cuda: bool) -> torch.dtype:
+    """Resolve settings.generative_dtype; "auto" means float16 on GPU, float32 on CPU."""
+    name = settings.generative_dtype.lower()
+    if name == "auto":
+        return torch.float16 if use_cuda else torch.float32
+    if name in ("float16", "bfloat16") and not use_cuda:
+        # Half-precision matmuls on CPU are slower than float32, not faster
+        logger.warning(f"{name} requested without CUDA, using float32")
+        return torch.float32
+    return getattr(torch, name)
+
+
+@lru_cache(maxsize=1)
+def _load_generative_pipeline():
+    try:
+        logger.info("Loading generative model...")
+        
+        # Use a lightweight conversational model
+        use_cuda = torch.cuda.is_available()
+        dtype = _generative_dtype(use_cuda)
+        model = AutoModelForCausalLM.from_pretrained(
+            "microsoft/DialoGPT-medium",
+            torch_dtype=dtype,
+            low_cpu_mem_usage=True
+        )
+        model.eval()
+        generator = pipeline(
+            "text-generation",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained("microsoft/DialoGPT-medium"),
+            device=0 if use_cuda else -1
+        )
+        # Batched prompts are left-padded so generation continues from each prompt's end
+        tokenizer = generator.tokenizer
+        tokenizer.padding_side = "left"
+        tokenizer.pad_token = tokenizer.eos_token
+        
+        logger.info(f"Generative model loaded successfully ({dtype})")
+        return generator
+        
+    except Exception as e:
+        logger.error(f"Failed to load generative model: {e}")
+        logger.info("Continuing with rule-based responses only")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _encode_segment(text: str) -> Tuple[int, ...]:
+    """Token ids for one prompt segment, cached so each turn is tokenized once."""
+    return tuple(get_generative_pipeline().tokenizer.encode(text))
+
+
+def get_generative_pipeline():
+    """Return the generative pipeline, loading it on first use.
+    
+    The weights are loaded once per process and shared by every
+    ResponseGenerator; the lock keeps concurrent first callers from
+    loading them twice.
+    """
+    with _pipeline_lock:
+        return _load_generative_pipeline()
+
+
+class StopOnTokens(StoppingCriteria):
+    """Stops generation once every sequence in the batch has emitted a stop token.
+    
+    Only the generated part is checked: the prompt length is taken from the
+    first call, when exactly one new token has been produced.
+    """
+    
+    def __init__(self, stop_token_ids: List[int]):
+        self.stop_token_ids = torch.tensor(stop_token_ids)
+        self.prompt_length = None
+    
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> bool:
+        if self.prompt_length is None:
+            self.prompt_length = input_ids.shape[1] - 1
+        generated = input_ids[:, self.prompt_length:]
+        stopped = torch.isin(generated, self.stop_token_ids.to(generated.device)).any(dim=1)
+        return bool(stopped.all())
+
 
 class ResponseGenerator:
     """Hybrid response generation system."""
     
     def __init__(self):
         self.rule_based_responses = self._load_rule_based_responses()
+        # Templates rotate round-robin per intent instead of drawing from the RNG
+        self._response_cycles = {
+            intent: cycle(responses) for intent, responses in self.rule_based_responses.items()
+        }
         self.faq_responses = self._load_faq_responses()
+        self.faq_matcher = FAQMatcher(self.faq_responses)
         self.generative_model = None
-        self._initialize_generative_model()
+        self.semantic_cache = None
+        # Concurrent generations share one batched pipeline call
+        self.generation_batcher = MicroBatcher(self._generate_batch, max_batch_size=8, max_latency_ms=10)
+        # Load the model in the background; FAQ and rule-based replies work meanwhile
+        self._model_future = _model_loader.submit(self._initialize_generative_model)
     
     def _initialize_generative_model(self):
-        """Initialize the generative AI model."""
-        try:
-            logger.info("Loading generative model...")
-            
-            # Use a lightweight conversational model
-            self.generative_model = pipeline(
-                "text-generation",
-                model="microsoft/DialoGPT-medium",
-                tokenizer="microsoft/DialoGPT-medium",
-                device=0 if torch.cuda.is_available() else -1
+        """Attach the process-wide generative pipeline and its semantic cache."""
+        self.generative_model = get_generative_pipeline()
+        self._initialize_semantic_cache()
+    
+    async def _ensure_generative_model(self):
+        """Wait for the background model load to finish, if it has not already."""
+        if not self._model_future.done():
+            await asyncio.wrap_future(self._model_future)
+        return self.generative_model
+    
+    async def warmup(self):
+        """Run one short generation so the first user request skips CUDA setup."""
+        if await self._ensure_generative_model():
+            await self.generation_batcher.submit(_encode_segment("Human: Hello\nBot:"))
+            logger.info("Generative model warmed up")
+    
+    def _initialize_semantic_cache(self):
+        """Set up the semantic cache for generated responses, if enabled."""
+        if not (settings.semantic_cache_enabled and self.generative_model):
+            return
+        
+        encoder = load_sentence_encoder(settings.semantic_cache_model_name)
+        if encoder:
+            self.semantic_cache = SemanticCache(
+                encoder,
+                threshold=settings.semantic_cache_threshold,
+                max_size=settings.semantic_cache_max_size,
+                ttl_seconds=settings.semantic_cache_ttl
             )
-            
-            logger.info("Generative model loaded successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to load generative model: {e}")
-            logger.info("Continuing with rule-based responses only")
     
     def _load_rule_based_responses(self) -> Dict[IntentType, List[str]]:
         """Load rule-based response templates."""
@@ -94,27 +218,60 @@ class ResponseGenerator:
     
     async def generate_response(self, message: Message, context: List[ConversationTurn]) -> str:
         """Generate response using hybrid approach."""
+        quick_response = self.generate_response_sync(message, context)
+        if quick_response is not None:
+            return quick_response
+        return await self.generate_generative_response(message, context)
+    
+    async def generate_generative_response(self, message: Message, context: List[ConversationTurn]) -> str:
+        """Generate a response for a message ``generate_response_sync`` deferred."""
+        try:
+            # Intent is unknown or confidence is low, so try the generative model
+            if await self._ensure_generative_model():
+                # Paraphrases of an earlier question reuse its generated answer
+                query_vector = None
+                if self.semantic_cache:
+                    # Encoding runs a transformer forward pass; keep it off the event loop
+                    query_vector = await asyncio.get_running_loop().run_in_executor(
+                        None, self.semantic_cache.embed, message.text
+                    )
+                if query_vector is not None:
+                    cached_response = self.semantic_cache.lookup(query_vector)
+                    if cached_response:
+                        return self._personalize_response(cached_response, message)
+                
+                generative_response = await self._generate_with_ai(message, context)
+                if generative_response and len(generative_response.strip()) > 0:
+                    if query_vector is not None:
+                        self.semantic_cache.store(query_vector, generative_response)
+                    return self._personalize_response(generative_response, message)
+            
+            # Fall back to rule-based response
+            return self._personalize_response(self._generate_rule_based_response(message), message)
+            
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return "I apologize, but I'm having trouble generating a response right now. Please try again."
+    
+    def generate_response_sync(self, message: Message, context: List[ConversationTurn]) -> Optional[str]:
+        """Answer FAQ matches and confident intents without awaiting.
+        
+        Returns None when the message should go to the generative model;
+        await ``generate_generative_response`` for those.
+        """
         try:
             # First check for FAQ match
             faq_response = self._check_faq(message.text)
             if faq_response:
                 return self._personalize_response(faq_response, message)
             
-            # Then try rule-based response
-            rule_response = self._generate_rule_based_response(message)
-            
-            # If intent is unknown or confidence is low, try generative model
+            # If intent is unknown or confidence is low, defer to the generative model
             if (message.intent.intent == IntentType.UNKNOWN or 
                 message.intent.confidence < 0.6 or 
                 message.intent.intent == IntentType.QUESTION):
-                
-                if self.generative_model:
-                    generative_response = await self._generate_with_ai(message, context)
-                    if generative_response and len(generative_response.strip()) > 0:
-                        return self._personalize_response(generative_response, message)
+                return None
             
-            # Fall back to rule-based response
-            return self._personalize_response(rule_response, message)
+            return self._personalize_response(self._generate_rule_based_response(message), message)
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
@@ -122,48 +279,31 @@ class ResponseGenerator:
     
     def _check_faq(self, text: str) -> Optional[str]:
         """Check if the text matches any FAQ."""
-        text_lower = text.lower()
-        
-        for question, answer in self.faq_responses.items():
-            # Simple keyword matching for FAQ
-            keywords = question.lower().split()
-            if all(keyword in text_lower for keyword in keywords):
-                return answer
-        
-        return None
+        return self.faq_matcher.match(text)
     
     def _generate_rule_based_response(self, message: Message) -> str:
         """Generate rule-based response based on intent."""
         intent = message.intent.intent
-        responses = self.rule_based_responses.get(intent, self.rule_based_responses[IntentType.UNKNOWN])
-        return random.choice(responses)
+        return next(self._response_cycles.get(intent, self._response_cycles[IntentType.UNKNOWN]))
     
     async def _generate_with_ai(self, message: Message, context: List[ConversationTurn]) -> Optional[str]:
         """Generate response using AI model."""
         try:
-            # Build conversation context
-            conversation_text = ""
-            for turn in context[-3:]:  # Last 3 turns for context
-                conversation_text += f"Human: {turn.message.text}\nBot: {turn.response.text}\n"
-            
-            conversation_text += f"Human: {message.text}\nBot:"
+            # Build the prompt from the last 3 turns; a turn's ids are reused
+            # from the segment cache for as long as it stays in the window
+            prompt_ids = []
+            for turn in context[-3:]:
+                prompt_ids.extend(_encode_segment(
+                    f"Human: {turn.user_message.text}\nBot: {turn.bot_response.text}\n"
+                ))
+            prompt_ids.extend(_encode_segment(f"Human: {message.text}\nBot:"))
             
-            # Generate response
-            outputs = self.generative_model(
-                conversation_text,
-                max_length=len(conversation_text) + 100,
-                num_return_sequences=1,
-                temperature=0.7,
-                do_sample=True,
-                pad_token_id=self.generative_model.tokenizer.eos_token_id
-            )
+            # Generate response, batched with any other in-flight requests
+            generated_text = await self.generation_batcher.submit(prompt_ids)
             
-            if outputs and len(outputs) > 0:
-                generated_text = outputs[0]['generated_text']
-                # Extract the bot response
-                bot_response = generated_text[len(conversation_text):].strip()
-                # Clean up the response
-                bot_response = bot_response.split('\n')[0].strip()
+            if generated_text:
+                # Keep only the first line of the reply
+                bot_response = generated_text.strip().split('\n')[0].strip()
                 
                 if len(bot_response) > 10:  # Ensure meaningful response
                     return bot_response
@@ -173,6 +313,39 @@ class ResponseGenerator:
         
         return None
     
+    def _generate_batch(self, prompts: List[Sequence[int]]) -> List[str]:
+        """Generate from a batch of tokenized prompts; returns the decoded continuation of each."""
+        model = self.generative_model.model
+        tokenizer = self.generative_model.tokenizer
+        
+        # Left-pad so generation continues from each prompt's end
+        width = max(len(ids) for ids in prompts)
+        input_ids = torch.full((len(prompts), width), tokenizer.eos_token_id, dtype=torch.long)
+        attention_mask = torch.zeros_like(input_ids)
+        for row, ids in enumerate(prompts):
+            input_ids[row, width - len(ids):] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, width - len(ids):] = 1
+        
+        if model.device.type == "cuda":
+            # Pinned host memory lets the copies run asynchronously via DMA
+            input_ids = input_ids.pin_memory().to(model.device, non_blocking=True)
+            attention_mask = attention_mask.pin_memory().to(model.device, non_blocking=True)
+        
+        # Only the first line of a reply is used, so stop decoding once every prompt has one
+        stop_on_newline = StopOnTokens([tokenizer.encode("\n")[0], tokenizer.eos_token_id])
+        with torch.inference_mode():
+            output_ids = model.generate(
+                input_ids,
+                attention_mask=attention_mask,
+                max_new_tokens=100,
+                temperature=0.7,
+                do_sample=True,
+                pad_token_id=tokenizer.eos_token_id,
+                stopping_criteria=StoppingCriteriaList([stop_on_newline])
+            )
+        # Decode only the generated tokens, never the prompt
+        return tokenizer.batch_decode(output_ids[:, width:], skip_special_tokens=True)
+    
     def _personalize_response(self, response: str, message: Message) -> str:
         """Personalize response based on sentiment and emotion."""
         try:
@@ -180,27 +353,12 @@ class ResponseGenerator:
                 return response
             
             sentiment = message.sentiment.sentiment
-            emotion = message.sentiment.emotion
-            
-            # Adjust tone based on sentiment
-            if sentiment == SentimentType.NEGATIVE:
-                if emotion == EmotionType.ANGER:
-                    response = f"I understand you're feeling frustrated. {response}"
-                elif emotion == EmotionType.SADNESS:
-                    response = f"I'm sorry you're feeling down. {response}"
-                else:
-                    response = f"I sense you might be having a difficult time. {response}"
-            
-            elif sentiment == SentimentType.POSITIVE:
-                if emotion == EmotionType.JOY:
-                    response = f"I'm glad you're in good spirits! {response}"
-                elif emotion == EmotionType.LOVE:
-                    response = f"It's wonderful to sense such positive energy! {response}"
-                else:
-                    response = f"I'm happy to help! {response}"
-            
-            return response
+            prefix = (
+                PERSONALIZATION_PREFIXES.get((sentiment, message.sentiment.emotion))
+                or PERSONALIZATION_PREFIXES.get((sentiment, None), "")
+            )
+            return prefix + response
             
         except Exception as e:
             logger.error(f"Error personalizing response: {e}")
-            return response
\ No newline at end of file
+            return response
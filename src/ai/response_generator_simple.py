@@ -1,21 +1,32 @@
 """
 Simplified response generation system for basic demo.
 """
-import random
+from itertools import cycle
 from typing import List, Dict, Any, Optional
 
 from models import Message, ConversationTurn, IntentType, SentimentType, EmotionType
 from utils.logger import setup_logger
+from ai.faq_matcher import FAQMatcher
 
 logger = setup_logger(__name__)
 
+SENTIMENT_PREFIXES = {
+    SentimentType.NEGATIVE: "I sense you might be having a difficult time. ",
+    SentimentType.POSITIVE: "I'm happy to help! ",
+}
+
 
 class ResponseGenerator:
     """Simplified response generation system using rule-based responses only."""
     
     def __init__(self):
         self.rule_based_responses = self._load_rule_based_responses()
+        # Templates rotate round-robin per intent instead of drawing from the RNG
+        self._response_cycles = {
+            intent: cycle(responses) for intent, responses in self.rule_based_responses.items()
+        }
         self.faq_responses = self._load_faq_responses()
+        self.faq_matcher = FAQMatcher(self.faq_responses, min_fraction=0.7)  # 70% of keywords must match
         logger.info("Simplified ResponseGenerator initialized")
     
     def _load_rule_based_responses(self) -> Dict[IntentType, List[str]]:
@@ -83,6 +94,10 @@ class ResponseGenerator:
     
     async def generate_response(self, message: Message, context: List[ConversationTurn]) -> str:
         """Generate response using simplified rule-based approach."""
+        return self.generate_response_sync(message, context)
+    
+    def generate_response_sync(self, message: Message, context: List[ConversationTurn]) -> str:
+        """Generate a response without awaiting; nothing in the rule-based path blocks."""
         try:
             # First check for FAQ match
             faq_response = self._check_faq(message.text)
@@ -101,32 +116,11 @@ class ResponseGenerator:
     
     def _check_faq(self, text: str) -> Optional[str]:
         """Check if the text matches any FAQ."""
-        text_lower = text.lower()
-        
-        for question, answer in self.faq_responses.items():
-            # Simple keyword matching for FAQ
-            keywords = question.lower().split()
-            if len(keywords) > 1:
-                # Check if most keywords are present
-                matches = sum(1 for keyword in keywords if keyword in text_lower)
-                if matches >= len(keywords) * 0.7:  # 70% of keywords match
-                    return answer
-            else:
-                # Single keyword check
-                if keywords[0] in text_lower:
-                    return answer
-        
-        return None
+        return self.faq_matcher.match(text)
     
     def _generate_rule_based_response(self, message: Message) -> str:
         """Generate rule-based response based on intent."""
-        if message.intent:
-            intent = message.intent
-            responses = self.rule_based_responses.get(intent, self.rule_based_responses[IntentType.UNKNOWN])
-        else:
-            responses = self.rule_based_responses[IntentType.UNKNOWN]
-        
-        return random.choice(responses)
+        return next(self._response_cycles.get(message.intent, self._response_cycles[IntentType.UNKNOWN]))
     
     def _personalize_response(self, response: str, message: Message) -> str:
         """Personalize response based on sentiment and emotion."""
@@ -134,15 +128,8 @@ class ResponseGenerator:
             if not message.sentiment:
                 return response
             
-            sentiment = message.sentiment
-            
             # Adjust tone based on sentiment
-            if sentiment == SentimentType.NEGATIVE:
-                response = f"I sense you might be having a difficult time. {response}"
-            elif sentiment == SentimentType.POSITIVE:
-                response = f"I'm happy to help! {response}"
-            
-            return response
+            return SENTIMENT_PREFIXES.get(message.sentiment, "") + response
             
         except Exception as e:
             logger.error(f"Error personalizing response: {e}")
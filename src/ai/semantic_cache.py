@@ -0,0 +1,102 @@
+"""
+Semantic response cache keyed by sentence-embedding similarity.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SemanticCache:
+    """Reuses generated responses for paraphrases of earlier messages.
+
+    Embeddings are L2-normalised and kept in a fixed-size matrix, so a lookup
+    is one matrix-vector product (cosine similarity) over at most ``max_size``
+    rows. Entries are evicted least-recently-used once the cache is full, and
+    ignored once they are older than ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        encoder: Callable[[str], np.ndarray],
+        threshold: float = 0.9,
+        max_size: int = 1000,
+        ttl_seconds: float = 3600
+    ):
+        self.encoder = encoder
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._vectors: Optional[np.ndarray] = None  # allocated on first store
+        self._valid = np.zeros(max_size, dtype=bool)
+        self._entries: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()  # slot -> (response, stored_at)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Encode text as a unit-length float32 vector."""
+        vector = np.asarray(self.encoder(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, vector: np.ndarray) -> Optional[str]:
+        """Return the cached response most similar to ``vector`` if it clears the threshold."""
+        if not self._entries:
+            self.misses += 1
+            return None
+
+        similarities = self._vectors @ vector
+        similarities[~self._valid] = -np.inf
+        slot = int(np.argmax(similarities))
+
+        if similarities[slot] < self.threshold:
+            self.misses += 1
+            return None
+
+        response, stored_at = self._entries[slot]
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            self._evict(slot)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(slot)
+        self.hits += 1
+        return response
+
+    def store(self, vector: np.ndarray, response: str):
+        """Cache ``response`` under ``vector``, evicting the least recently used entry if full."""
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+
+        if len(self._entries) >= self.max_size:
+            self._evict(next(iter(self._entries)))
+
+        slot = int(np.argmin(self._valid))  # first free slot
+        self._vectors[slot] = vector
+        self._valid[slot] = True
+        self._entries[slot] = (response, time.monotonic())
+
+    def _evict(self, slot: int):
+        del self._entries[slot]
+        self._valid[slot] = False
+
+
+def load_sentence_encoder(model_name: str) -> Optional[Callable[[str], np.ndarray]]:
+    """Load a sentence-transformers encoder, or return None if it is unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name)
+        logger.info("Loaded semantic cache encoder {}", model_name)
+        return model.encode
+    except Exception as e:
+        logger.warning("Semantic cache disabled, could not load encoder {}: {}", model_name, e)
+        return None
@@ -1,85 +1,115 @@
 """
 In-memory analytics service for collecting and aggregating chatbot events.
 """
-from typing import Dict, List, Any
-from collections import defaultdict
+import threading
+from typing import Deque, Dict, Any, Iterable
+from collections import Counter, defaultdict, deque
 
 from models import AnalyticsEvent
+from config import settings
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class InMemoryAnalytics:
-    """In-memory analytics collector for demo purposes."""
+    """In-memory analytics collector for demo purposes.
+    
+    Aggregates are updated as events are logged, so ``get_stats`` costs the
+    same no matter how many events have been seen. The lock is shared by
+    ``log_events`` batches and ``get_stats``, so a stats read never sees a
+    batch half-applied, including from the dashboard's threaded handlers.
+    """
     
     def __init__(self):
-        self.events: List[AnalyticsEvent] = []
+        self.keep_raw_events = settings.analytics_keep_raw_events
+        # Only the most recent events are kept; lifetime totals live in the counters
+        self.events: Deque[AnalyticsEvent] = deque(maxlen=settings.analytics_max_events)
+        self._lock = threading.Lock()
+        self._reset_counters()
         logger.info("InMemoryAnalytics initialized")
     
+    def _reset_counters(self):
+        self._event_count = 0
+        self._session_message_counts: Dict[str, int] = defaultdict(int)
+        self._total_messages = 0
+        self._intent_dist: Counter = Counter()
+        self._sentiment_dist: Counter = Counter()
+        self._platform_dist: Counter = Counter()
+        self._response_time_total = 0.0
+        self._response_time_count = 0
+    
     def log_event(self, event: AnalyticsEvent):
         """Log an analytics event."""
-        self.events.append(event)
-        logger.debug(f"Logged analytics event: {event.event_type}")
+        self.log_events((event,))
+    
+    def log_events(self, events: Iterable[AnalyticsEvent]):
+        """Log a batch of analytics events under a single lock acquisition."""
+        with self._lock:
+            for event in events:
+                if self.keep_raw_events:
+                    self.events.append(event)
+                self._event_count += 1
+                self._platform_dist[event.platform.value] += 1
+                if event.event_type == "message_processed":
+                    self._count_message(event)
+                logger.debug("Logged analytics event: {}", event.event_type)
+    
+    def _count_message(self, event: AnalyticsEvent):
+        self._total_messages += 1
+        self._session_message_counts[event.session_id] += 1
+        
+        data = event.data
+        if not data:
+            return
+        
+        intent_data = data.get("intent")
+        if intent_data and isinstance(intent_data, dict):
+            intent = intent_data.get("intent")
+            if intent:
+                self._intent_dist[intent] += 1
+        
+        sentiment_data = data.get("sentiment")
+        if sentiment_data and isinstance(sentiment_data, dict):
+            sentiment = sentiment_data.get("sentiment")
+            if sentiment:
+                self._sentiment_dist[sentiment] += 1
+        
+        if "response_time_ms" in data:
+            self._response_time_total += data["response_time_ms"]
+            self._response_time_count += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """Get aggregated analytics statistics."""
         try:
-            if not self.events:
-                return self._get_empty_stats()
-            
-            # Aggregate data
-            total_conversations = len(set(e.session_id for e in self.events if e.event_type == "message_processed"))
-            total_messages = len([e for e in self.events if e.event_type == "message_processed"])
-            
-            # Average conversation length (rough estimate)
-            conversation_lengths = defaultdict(int)
-            for e in self.events:
-                if e.event_type == "message_processed":
-                    conversation_lengths[e.session_id] += 1
-            avg_conversation_length = sum(conversation_lengths.values()) / len(conversation_lengths) if conversation_lengths else 0
-            
-            # Intent distribution
-            intent_dist = defaultdict(int)
-            for e in self.events:
-                if e.event_type == "message_processed" and e.data:
-                    intent_data = e.data.get("intent")
-                    if intent_data and isinstance(intent_data, dict):
-                        intent = intent_data.get("intent")
-                        if intent:
-                            intent_dist[intent] += 1
-            
-            # Sentiment distribution
-            sentiment_dist = defaultdict(int)
-            for e in self.events:
-                if e.event_type == "message_processed" and e.data:
-                    sentiment_data = e.data.get("sentiment")
-                    if sentiment_data and isinstance(sentiment_data, dict):
-                        sentiment = sentiment_data.get("sentiment")
-                        if sentiment:
-                            sentiment_dist[sentiment] += 1
-            
-            # Platform distribution
-            platform_dist = defaultdict(int)
-            for e in self.events:
-                platform_dist[e.platform.value] += 1
-            
-            # Average response time (placeholder, since not stored)
-            avg_response_time = 350.0  # ms
-            
-            # User satisfaction (placeholder)
-            user_satisfaction = 4.1
-            
-            return {
-                "total_conversations": total_conversations,
-                "total_messages": total_messages,
-                "average_conversation_length": round(avg_conversation_length, 1),
-                "intent_distribution": dict(intent_dist),
-                "sentiment_distribution": dict(sentiment_dist),
-                "platform_distribution": dict(platform_dist),
-                "average_response_time_ms": avg_response_time,
-                "user_satisfaction_rating": user_satisfaction
-            }
+            with self._lock:
+                if not self._event_count:
+                    return self._get_empty_stats()
+                
+                total_conversations = len(self._session_message_counts)
+                
+                # Average conversation length (rough estimate)
+                avg_conversation_length = self._total_messages / total_conversations if total_conversations else 0
+                
+                # Average response time over messages that recorded one
+                avg_response_time = (
+                    round(self._response_time_total / self._response_time_count, 1)
+                    if self._response_time_count else 0.0
+                )
+                
+                # User satisfaction (placeholder)
+                user_satisfaction = 4.1
+                
+                return {
+                    "total_conversations": total_conversations,
+                    "total_messages": self._total_messages,
+                    "average_conversation_length": round(avg_conversation_length, 1),
+                    "intent_distribution": dict(self._intent_dist),
+                    "sentiment_distribution": dict(self._sentiment_dist),
+                    "platform_distribution": dict(self._platform_dist),
+                    "average_response_time_ms": avg_response_time,
+                    "user_satisfaction_rating": user_satisfaction
+                }
             
         except Exception as e:
             logger.error(f"Error aggregating analytics: {e}")
@@ -99,8 +129,10 @@ class InMemoryAnalytics:
         }
     
     def clear_events(self):
-        """Clear all events (for testing)."""
-        self.events.clear()
+        """Clear all events and counters (for testing)."""
+        with self._lock:
+            self.events.clear()
+            self._reset_counters()
         logger.info("Cleared all analytics events")
 
 
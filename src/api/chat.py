@@ -1,9 +1,12 @@
 """
 Main chat manager that orchestrates all chatbot components.
 """
+import asyncio
+import time
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Deque, Tuple
 
 from models import (
     ChatRequest, ChatResponse, Message, Response, Session, 
@@ -15,12 +18,19 @@ from nlp.sentiment_analysis_simple import SentimentAnalyzer
 from nlp.ner_simple import NamedEntityRecognizer
 from ai.response_generator_simple import ResponseGenerator
 from utils.session_manager import SessionManager
+from utils.caching import async_ttl_cache
 from utils.logger import setup_logger
+from config import settings
 from analytics import analytics
 
 logger = setup_logger(__name__)
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter_ns()`` reading."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
 class ChatManager:
     """Main chat manager that orchestrates all chatbot components."""
     
@@ -37,11 +47,17 @@ class ChatManager:
         self.ner = ner
         self.response_generator = response_generator
         self.session_manager = session_manager or SessionManager()
+        # Analytics events wait here until the loop is idle, off the request path.
+        # If a loop closes before its flush runs, its events stay queued until
+        # the next logged event or stats read flushes them.
+        self._pending_analytics: Deque[Tuple[str, Session, Message, float]] = deque()
+        self._analytics_flush_loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info("ChatManager initialized successfully")
     
     async def process_message(self, request: ChatRequest) -> ChatResponse:
         """Process a user message and generate a bot response."""
+        start_ns = time.perf_counter_ns()
         try:
             # Get or create session
             session_id = request.session_id or str(uuid.uuid4())
@@ -67,13 +83,17 @@ class ChatManager:
             response = await self._generate_response(message, session)
             
             # Create conversation turn (model fields: user_message, bot_response)
-            turn = ConversationTurn(user_message=message, bot_response=response)
+            turn = ConversationTurn(
+                user_message=message,
+                bot_response=response,
+                processing_time_ms=_elapsed_ms(start_ns)
+            )
             
             # Update session with new turn
             await self.session_manager.add_conversation_turn(session_id, turn)
             
             # Log analytics event
-            await self._log_analytics_event("message_processed", session, message)
+            self._log_analytics_event("message_processed", session, message, turn.processing_time_ms)
             
             # Create API response
             # Build ChatResponse using model fields
@@ -88,11 +108,11 @@ class ChatManager:
                 suggestions=[]
             )
             
-            logger.info(f"Processed message successfully for session {session_id}")
+            logger.info("Processed message successfully for session {}", session_id)
             return chat_response
             
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.exception("Error processing message: {}", e)
             # Return fallback response
             return ChatResponse(
                 message="I apologize, but I'm having trouble processing your message right now. Please try again.",
@@ -100,11 +120,110 @@ class ChatManager:
                 confidence=0.1
             )
     
+    async def warmup(self):
+        """Run a throwaway message through the NLP and response pipeline.
+        
+        Nothing is stored: the session is not registered and no analytics
+        event is logged, so warmup leaves no trace in user-facing data.
+        """
+        session = Session(user_id="warmup", platform=Platform.API)
+        message = Message(
+            id=str(uuid.uuid4()),
+            text="ping",
+            user_id=session.user_id,
+            session_id=session.id,
+            platform=session.platform
+        )
+        await self._analyze_message(message)
+        await self._generate_response(message, session)
+        # Generators backed by a model also warm it up directly
+        generator_warmup = getattr(self.response_generator, "warmup", None)
+        if generator_warmup:
+            await generator_warmup()
+        logger.info("ChatManager warmup completed")
+    
+    async def process_message_stream(self, request: ChatRequest) -> AsyncIterator[Dict[str, Any]]:
+        """Process a user message and yield the bot response as it is produced.
+        
+        Yields ``{"delta": text}`` chunks, then a final ``{"done": True, ...}``
+        event carrying the session id and NLP results.
+        """
+        start_ns = time.perf_counter_ns()
+        session_id = request.session_id or str(uuid.uuid4())
+        session = await self.session_manager.get_or_create_session(
+            session_id=session_id,
+            user_id=request.user_id,
+            platform=request.platform
+        )
+        
+        message = Message(
+            id=str(uuid.uuid4()),
+            text=request.message,
+            user_id=request.user_id,
+            session_id=session_id,
+            platform=request.platform
+        )
+        await self._analyze_message(message)
+        
+        chunks = []
+        confidence = 0.8
+        try:
+            async for delta in self._stream_response_text(message, session):
+                chunks.append(delta)
+                yield {"delta": delta}
+        except Exception as e:
+            logger.exception("Error streaming response: {}", e)
+            if not chunks:
+                fallback = "I'm sorry, I didn't understand that. Could you please rephrase your question?"
+                chunks.append(fallback)
+                confidence = 0.1
+                yield {"delta": fallback}
+        
+        response = Response(
+            id=str(uuid.uuid4()),
+            text="".join(chunks),
+            session_id=session.id,
+            confidence=confidence
+        )
+        turn = ConversationTurn(
+            user_message=message,
+            bot_response=response,
+            processing_time_ms=_elapsed_ms(start_ns)
+        )
+        await self.session_manager.add_conversation_turn(session_id, turn)
+        self._log_analytics_event("message_processed", session, message, turn.processing_time_ms)
+        
+        yield {
+            "done": True,
+            "session_id": session_id,
+            "intent": message.intent,
+            "sentiment": message.sentiment,
+            "confidence": response.confidence
+        }
+    
+    async def _stream_response_text(self, message: Message, session: Session) -> AsyncIterator[str]:
+        """Yield response text chunks, word by word if the generator cannot stream."""
+        stream = getattr(self.response_generator, "stream_response", None)
+        if stream is not None:
+            async for delta in stream(message=message, context=session.context):
+                yield delta
+            return
+        
+        text = await self._generate_response_text(message, session)
+        for i, word in enumerate(text.split(" ")):
+            yield word if i == 0 else " " + word
+    
     async def _analyze_message(self, message: Message):
         """Perform NLP analysis on the message."""
         try:
+            # The three analyses are independent, so run them concurrently
+            intent_result, message.entities, sentiment_result = await asyncio.gather(
+                self.intent_recognizer.recognize_intent(message.text),
+                self.ner.extract_entities(message.text),
+                self.sentiment_analyzer.analyze_sentiment(message.text)
+            )
+            
             # Intent recognition
-            intent_result = await self.intent_recognizer.recognize_intent(message.text)
             if hasattr(intent_result, 'intent'):  # IntentPrediction
                 message.intent = intent_result.intent
                 message.metadata["intent_prediction"] = intent_result.dict()
@@ -112,11 +231,7 @@ class ChatManager:
                 message.intent = intent_result
                 message.metadata["intent_prediction"] = {"intent": intent_result, "confidence": 0.8}
             
-            # Named entity recognition
-            message.entities = await self.ner.extract_entities(message.text)
-            
             # Sentiment analysis
-            sentiment_result = await self.sentiment_analyzer.analyze_sentiment(message.text)
             if hasattr(sentiment_result, 'sentiment'):  # SentimentPrediction
                 message.sentiment = sentiment_result.sentiment
                 message.metadata["sentiment_prediction"] = sentiment_result.dict()
@@ -124,19 +239,34 @@ class ChatManager:
                 message.sentiment = sentiment_result
                 message.metadata["sentiment_prediction"] = {"sentiment": sentiment_result, "confidence": 0.8, "scores": {}}
             
-            logger.debug(f"NLP analysis completed for message: {message.id}")
+            logger.debug("NLP analysis completed for message: {}", message.id)
             
         except Exception as e:
-            logger.error(f"Error in NLP analysis: {e}")
+            logger.exception("Error in NLP analysis: {}", e)
             # Continue with default values
     
-    async def _generate_response(self, message: Message, session: Session) -> Response:
-        """Generate bot response using the hybrid approach."""
-        try:
-            response_text = await self.response_generator.generate_response(
+    async def _generate_response_text(self, message: Message, session: Session) -> str:
+        """Call the generator synchronously when it can answer without awaiting."""
+        generate_sync = getattr(self.response_generator, "generate_response_sync", None)
+        if generate_sync is None:
+            return await self.response_generator.generate_response(
                 message=message,
                 context=session.context
             )
+        
+        text = generate_sync(message, session.context)
+        if text is not None:
+            return text
+        # The sync pass already ruled out FAQ and rule-based answers
+        return await self.response_generator.generate_generative_response(
+            message=message,
+            context=session.context
+        )
+    
+    async def _generate_response(self, message: Message, session: Session) -> Response:
+        """Generate bot response using the hybrid approach."""
+        try:
+            response_text = await self._generate_response_text(message, session)
             
             response = Response(
                 id=str(uuid.uuid4()),
@@ -145,11 +275,11 @@ class ChatManager:
                 confidence=0.8  # This would be calculated based on the generation method
             )
             
-            logger.debug(f"Generated response: {response.id}")
+            logger.debug("Generated response: {}", response.id)
             return response
             
         except Exception as e:
-            logger.error(f"Error generating response: {e}")
+            logger.exception("Error generating response: {}", e)
             # Fallback response
             return Response(
                 id=str(uuid.uuid4()),
@@ -158,29 +288,51 @@ class ChatManager:
                 confidence=0.1
             )
     
-    async def _log_analytics_event(self, event_type: str, session: Session, message: Message):
-        """Log analytics event."""
-        try:
-            event = AnalyticsEvent(
-                event_type=event_type,
-                session_id=session.id,
-                user_id=session.user_id,
-                platform=session.platform,
-                data={
-                    "message_length": len(message.text),
-                    "intent": message.metadata.get("intent_prediction"),
-                    "sentiment": message.metadata.get("sentiment_prediction"),
-                    "entities_count": len(message.entities)
-                }
-            )
-            
-            # Log to analytics service
-            analytics.log_event(event)
-            
-            logger.debug(f"Analytics event logged: {event.event_type}")
-            
-        except Exception as e:
-            logger.error(f"Error logging analytics event: {e}")
+    def _log_analytics_event(
+        self,
+        event_type: str,
+        session: Session,
+        message: Message,
+        response_time_ms: float = 0.0
+    ):
+        """Queue an analytics event; it is built and recorded once the loop is free."""
+        self._pending_analytics.append((event_type, session, message, response_time_ms))
+        
+        loop = asyncio.get_running_loop()
+        # One flush per loop iteration drains everything queued in the meantime
+        if self._analytics_flush_loop is not loop:
+            self._analytics_flush_loop = loop
+            loop.call_soon(self._flush_analytics_events)
+    
+    def _flush_analytics_events(self):
+        """Build and log every queued analytics event in one batch."""
+        self._analytics_flush_loop = None
+        events = []
+        while self._pending_analytics:
+            event_type, session, message, response_time_ms = self._pending_analytics.popleft()
+            try:
+                events.append(AnalyticsEvent(
+                    event_type=event_type,
+                    session_id=session.id,
+                    user_id=session.user_id,
+                    platform=session.platform,
+                    data={
+                        "message_length": len(message.text),
+                        "intent": message.metadata.get("intent_prediction"),
+                        "sentiment": message.metadata.get("sentiment_prediction"),
+                        "entities_count": len(message.entities),
+                        "response_time_ms": response_time_ms
+                    }
+                ))
+            except Exception as e:
+                logger.exception("Error building analytics event: {}", e)
+        
+        if events:
+            try:
+                # Log to analytics service
+                analytics.log_events(events)
+            except Exception as e:
+                logger.exception("Error logging {} analytics events: {}", len(events), e)
     
     async def get_session(self, session_id: str) -> Optional[Session]:
         """Get session by ID."""
@@ -190,12 +342,16 @@ class ChatManager:
         """Delete session by ID."""
         await self.session_manager.delete_session(session_id)
     
+    @async_ttl_cache(settings.analytics_stats_cache_ttl)
     async def get_analytics_stats(self) -> Dict[str, Any]:
-        """Get analytics statistics."""
+        """Get analytics statistics, shared by all callers within the cache TTL."""
         try:
+            # Events still queued from recent requests count too
+            self._flush_analytics_events()
+            # Stats are read from running counters, cheap enough for the event loop
             return analytics.get_stats()
         except Exception as e:
-            logger.error(f"Error getting analytics stats: {e}")
+            logger.exception("Error getting analytics stats: {}", e)
             return {
                 "total_sessions": 0,
                 "total_messages": 0,
@@ -1,25 +1,50 @@
 """
 FastAPI application for the Dynamic AI Chatbot.
 """
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-import traceback
-from typing import Dict, Any
+import asyncio
+import json
+from typing import Any, Callable, Dict
 from pathlib import Path
+from pydantic import BaseModel
 
-from models import ChatRequest, ChatResponse
-from api.chat import ChatManager
-from api.dependencies import get_chat_manager
+from models import ChatRequest, ChatResponse, Session
+from api.dependencies import ChatManagerDep, build_chat_manager
 from auth.router import router as auth_router
 from auth.repository import user_repository
 from connectors.slack import SlackConnector
 from connectors.telegram import TelegramConnector
+from config import settings
 from utils.logger import setup_logger
+from utils.rate_limiter import UserConcurrencyLimiter
 
 logger = setup_logger(__name__)
 
+# How often expired sessions are swept from memory
+SESSION_CLEANUP_INTERVAL_SECONDS = 60
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that calls ``on_close`` however the response ends.
+    
+    The body generator's ``finally`` is not enough on its own: if the client
+    disconnects before the first chunk is requested, the generator never
+    starts and its cleanup never runs.
+    """
+    
+    def __init__(self, *args, on_close: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_close = on_close
+    
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.on_close()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -48,6 +73,11 @@ def create_app() -> FastAPI:
     # Include authentication router
     app.include_router(auth_router)
     
+    # Build the chat manager once; endpoints read it from app.state
+    app.state.chat_manager = build_chat_manager()
+    app.state.chat_limiter = UserConcurrencyLimiter(settings.max_concurrent_chats_per_user)
+    app.state.ready = False
+    
     # Initialize connectors
     slack_connector = SlackConnector()
     telegram_connector = TelegramConnector()
@@ -55,32 +85,85 @@ def create_app() -> FastAPI:
     # Global exception handler
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
-        logger.error(f"Global exception: {exc}\n{traceback.format_exc()}")
+        logger.opt(exception=exc).error("Global exception: {}", exc)
         return JSONResponse(
             status_code=500,
             content={"detail": "Internal server error"}
         )
     
-    # Health check endpoint
-    @app.get("/health")
+    # Health check endpoint (HEAD lets probes skip the body)
+    @app.api_route("/health", methods=["GET", "HEAD"])
     async def health_check():
         """Health check endpoint."""
         return {"status": "healthy", "message": "Dynamic AI Chatbot is running"}
     
+    # Readiness probe: 503 until the startup warmup has finished
+    @app.get("/ready")
+    async def readiness_check():
+        """Readiness check endpoint."""
+        if not app.state.ready:
+            return JSONResponse(status_code=503, content={"status": "warming_up"})
+        return {"status": "ready"}
+    
+    def model_response(model: BaseModel) -> Response:
+        """Serialize a model with pydantic-core, skipping FastAPI's re-validation and jsonable_encoder pass."""
+        return Response(content=model.model_dump_json(), media_type="application/json")
+    
+    def acquire_chat_slot(user_id: str):
+        """Reject the request if the user already has too many chats in flight."""
+        if not app.state.chat_limiter.try_acquire(user_id):
+            raise HTTPException(status_code=429, detail="Too many concurrent chat requests")
+    
     # Main chat endpoint
     @app.post("/chat", response_model=ChatResponse)
     async def chat(
         request: ChatRequest,
-        chat_manager: ChatManager = Depends(get_chat_manager)
+        chat_manager: ChatManagerDep
     ):
         """Process a chat message and return bot response."""
+        acquire_chat_slot(request.user_id)
         try:
-            logger.info(f"Processing chat request from user {request.user_id}")
+            logger.info("Processing chat request from user {}", request.user_id)
             response = await chat_manager.process_message(request)
-            return response
+            return model_response(response)
         except Exception as e:
-            logger.error(f"Error processing chat request: {e}")
+            logger.exception("Error processing chat request: {}", e)
             raise HTTPException(status_code=500, detail="Failed to process message")
+        finally:
+            app.state.chat_limiter.release(request.user_id)
+    
+    @app.post("/chat/stream")
+    async def chat_stream(
+        request: ChatRequest,
+        chat_manager: ChatManagerDep
+    ):
+        """Stream the bot response as server-sent events."""
+        acquire_chat_slot(request.user_id)
+        released = False
+        
+        def release_slot():
+            # Called from both the generator and the response; release only once
+            nonlocal released
+            if not released:
+                released = True
+                app.state.chat_limiter.release(request.user_id)
+        
+        async def event_source():
+            try:
+                async for event in chat_manager.process_message_stream(request):
+                    yield f"data: {json.dumps(event)}\n\n"
+            except Exception as e:
+                logger.exception("Error streaming chat response: {}", e)
+                yield f"data: {json.dumps({'error': 'Failed to process message'})}\n\n"
+            finally:
+                release_slot()
+        
+        return ClosingStreamingResponse(
+            event_source(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            on_close=release_slot
+        )
     
     # Webhook endpoints
     @app.post("/webhook/slack")
@@ -89,7 +172,7 @@ def create_app() -> FastAPI:
         try:
             return await slack_connector.handle_webhook(request)
         except Exception as e:
-            logger.error(f"Error in Slack webhook: {e}")
+            logger.exception("Error in Slack webhook: {}", e)
             raise HTTPException(status_code=500, detail="Webhook processing failed")
     
     @app.post("/webhook/telegram")
@@ -98,61 +181,80 @@ def create_app() -> FastAPI:
         try:
             return await telegram_connector.handle_webhook(request)
         except Exception as e:
-            logger.error(f"Error in Telegram webhook: {e}")
+            logger.exception("Error in Telegram webhook: {}", e)
             raise HTTPException(status_code=500, detail="Webhook processing failed")
     
     # Session management endpoints
-    @app.get("/session/{session_id}")
+    @app.get("/session/{session_id}", response_model=Session)
     async def get_session(
         session_id: str,
-        chat_manager: ChatManager = Depends(get_chat_manager)
+        chat_manager: ChatManagerDep
     ):
         """Get session information."""
         try:
             session = await chat_manager.get_session(session_id)
             if not session:
                 raise HTTPException(status_code=404, detail="Session not found")
-            return session
+            return model_response(session)
         except Exception as e:
-            logger.error(f"Error getting session {session_id}: {e}")
+            logger.exception("Error getting session {}: {}", session_id, e)
             raise HTTPException(status_code=500, detail="Failed to get session")
     
     @app.delete("/session/{session_id}")
     async def delete_session(
         session_id: str,
-        chat_manager: ChatManager = Depends(get_chat_manager)
+        chat_manager: ChatManagerDep
     ):
         """Delete a session."""
         try:
             await chat_manager.delete_session(session_id)
             return {"message": "Session deleted successfully"}
         except Exception as e:
-            logger.error(f"Error deleting session {session_id}: {e}")
+            logger.exception("Error deleting session {}: {}", session_id, e)
             raise HTTPException(status_code=500, detail="Failed to delete session")
     
     # Analytics endpoints
     @app.get("/analytics/stats")
     async def get_analytics_stats(
-        chat_manager: ChatManager = Depends(get_chat_manager)
+        chat_manager: ChatManagerDep
     ):
         """Get conversation analytics stats."""
         try:
             stats = await chat_manager.get_analytics_stats()
             return stats
         except Exception as e:
-            logger.error(f"Error getting analytics stats: {e}")
+            logger.exception("Error getting analytics stats: {}", e)
             raise HTTPException(status_code=500, detail="Failed to get analytics")
     
     logger.info("FastAPI application created successfully")
     
+    async def session_cleanup_loop():
+        """Periodically evict expired sessions."""
+        session_manager = app.state.chat_manager.session_manager
+        while True:
+            await asyncio.sleep(SESSION_CLEANUP_INTERVAL_SECONDS)
+            await session_manager.cleanup_expired_sessions()
+    
     # Initialize database indexes on startup
     @app.on_event("startup")
     async def startup_event():
+        app.state.session_cleanup_task = asyncio.create_task(session_cleanup_loop())
+        
+        try:
+            await app.state.chat_manager.warmup()
+        except Exception as e:
+            logger.warning("Chat pipeline warmup failed: {}", e)
+        app.state.ready = True
+        
         try:
             await user_repository.create_indexes()
             logger.info("Database indexes created successfully")
         except Exception as e:
-            logger.warning(f"Could not create database indexes: {e}")
+            logger.warning("Could not create database indexes: {}", e)
             logger.info("Application will continue without database indexes - they will be created when needed")
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        app.state.session_cleanup_task.cancel()
 
     return app
\ No newline at end of file
@@ -5,7 +5,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 
-from auth.utils import jwt_manager
+from auth.utils import jwt_manager, token_cache
 from auth.repository import user_repository
 from auth.models import UserProfile, TokenData
 
@@ -24,6 +24,10 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    cached_user = token_cache.get(credentials.credentials)
+    if cached_user is not None:
+        return cached_user
+    
     try:
         # Verify the token
         payload = jwt_manager.verify_token(credentials.credentials)
@@ -42,7 +46,7 @@ async def get_current_user(
     if user_doc is None:
         raise credentials_exception
     
-    return UserProfile(
+    user = UserProfile(
         id=user_doc["_id"],
         username=user_doc["username"],
         email=user_doc["email"],
@@ -50,6 +54,9 @@ async def get_current_user(
         created_at=user_doc["created_at"],
         is_active=user_doc["is_active"]
     )
+    # Tokens without an exp claim are still capped by the cache TTL
+    token_cache.put(credentials.credentials, user, payload.get("exp"))
+    return user
 
 
 async def get_current_active_user(
@@ -8,7 +8,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import DuplicateKeyError
 
 from auth.models import UserSignup, UserProfile
-from auth.utils import password_manager
+from auth.utils import password_manager, token_cache
 from config import settings
 
 
@@ -109,11 +109,13 @@ class UserRepository:
             {"_id": user_id},
             {"$set": update_data}
         )
+        token_cache.invalidate_user(user_id)
         return result.modified_count > 0
     
     async def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
         result = await self.users_collection.delete_one({"_id": user_id})
+        token_cache.invalidate_user(user_id)
         return result.deleted_count > 0
 
 
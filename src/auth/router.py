@@ -3,11 +3,12 @@ Authentication API endpoints.
 """
 from datetime import timedelta
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import JSONResponse
 
 from auth.models import UserSignup, UserLogin, Token, UserProfile
 from auth.repository import user_repository
-from auth.utils import jwt_manager, ACCESS_TOKEN_EXPIRE_MINUTES
+from auth.utils import jwt_manager, token_cache, ACCESS_TOKEN_EXPIRE_MINUTES
 from auth.dependencies import get_current_active_user
 from utils.logger import setup_logger
 
@@ -102,8 +103,12 @@ async def get_current_user_profile(
 
 
 @router.post("/logout")
-async def logout():
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))
+):
     """Logout user (client should delete the token)."""
+    if credentials is not None:
+        token_cache.invalidate(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 
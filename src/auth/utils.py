@@ -2,16 +2,24 @@
 Authentication utilities for password hashing and JWT tokens.
 """
 import jwt
+import time
 import bcrypt
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from fastapi import HTTPException, status
 
+from auth.models import UserProfile
+
 # JWT Configuration - In production, use environment variables
 SECRET_KEY = "your-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Verified tokens are cached so authenticated requests skip decoding and the user lookup
+TOKEN_CACHE_MAX_SIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 300
+
 
 class PasswordManager:
     """Handle password hashing and verification."""
@@ -68,6 +76,56 @@ class JWTManager:
             )
 
 
+class TokenCache:
+    """LRU cache mapping verified tokens to their user profiles.
+    
+    An entry expires at the token's own ``exp`` or after ``ttl_seconds``,
+    whichever comes first, so a cached token is never accepted past its
+    expiry. The cache is per process: ``invalidate_user`` only clears the
+    worker that handled the change, so other workers may keep serving the
+    old profile (``is_active`` included) for up to ``ttl_seconds``.
+    """
+    
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE, ttl_seconds: float = TOKEN_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, UserProfile]]" = OrderedDict()
+    
+    def get(self, token: str) -> Optional[UserProfile]:
+        """Return the cached profile for a token, or None if absent or expired."""
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        
+        expires_at, profile = entry
+        if time.time() >= expires_at:
+            del self._entries[token]
+            return None
+        
+        self._entries.move_to_end(token)
+        return profile
+    
+    def put(self, token: str, profile: UserProfile, token_expires_at: Optional[float] = None):
+        """Cache a verified token until its ``exp`` (a Unix timestamp, if any) or the TTL."""
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(token_expires_at, expires_at)
+        self._entries[token] = (expires_at, profile)
+        self._entries.move_to_end(token)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, token: str):
+        """Forget a single token, e.g. on logout."""
+        self._entries.pop(token, None)
+    
+    def invalidate_user(self, user_id: str):
+        """Forget every token of a user whose profile changed."""
+        for token in [token for token, (_, profile) in self._entries.items() if profile.id == user_id]:
+            del self._entries[token]
+
+
 # Create instances for easy import
 password_manager = PasswordManager()
-jwt_manager = JWTManager()
\ No newline at end of file
+jwt_manager = JWTManager()
+token_cache = TokenCache()
\ No newline at end of file
@@ -46,9 +46,25 @@ class Settings(BaseSettings):
     session_timeout: int = Field(default=3600, env="SESSION_TIMEOUT")
     max_context_length: int = Field(default=10, env="MAX_CONTEXT_LENGTH")
     
+    # Analytics
+    analytics_keep_raw_events: bool = Field(default=True, env="ANALYTICS_KEEP_RAW_EVENTS")
+    analytics_max_events: int = Field(default=10000, env="ANALYTICS_MAX_EVENTS")
+    analytics_stats_cache_ttl: float = Field(default=5.0, env="ANALYTICS_STATS_CACHE_TTL")
+    
+    # Rate Limiting
+    max_concurrent_chats_per_user: int = Field(default=5, env="MAX_CONCURRENT_CHATS_PER_USER")
+    
     # Model Configuration
     intent_model_name: str = Field(default="bert-base-uncased", env="INTENT_MODEL_NAME")
     sentiment_model_name: str = Field(default="cardiffnlp/twitter-roberta-base-sentiment-latest", env="SENTIMENT_MODEL_NAME")
+    generative_dtype: str = Field(default="auto", env="GENERATIVE_DTYPE")  # auto, float16, bfloat16 or float32
+    
+    # Semantic Response Cache
+    semantic_cache_enabled: bool = Field(default=True, env="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_model_name: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", env="SEMANTIC_CACHE_MODEL_NAME")
+    semantic_cache_threshold: float = Field(default=0.9, env="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_max_size: int = Field(default=1000, env="SEMANTIC_CACHE_MAX_SIZE")
+    semantic_cache_ttl: int = Field(default=3600, env="SEMANTIC_CACHE_TTL")
     
     class Config:
         env_file = ".env"
@@ -105,9 +105,7 @@ class SlackConnector:
                 # Parse and process message
                 chat_request = self.parse_slack_event(payload)
                 
-                # Import here to avoid circular imports
-                from api.dependencies import get_chat_manager
-                chat_manager = get_chat_manager()
+                chat_manager = request.app.state.chat_manager
                 
                 # Process message
                 response = await chat_manager.process_message(chat_request)
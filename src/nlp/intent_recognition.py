@@ -1,7 +1,6 @@
 """
 Intent recognition using BERT-based models.
 """
-import re
 from typing import Dict, List
 
 # Try to import transformers.pipeline; if unavailable, we'll fall back to rule-based only
@@ -15,6 +14,8 @@ except Exception:
 from models import IntentPrediction, IntentType
 from config import settings
 from utils.logger import setup_logger
+from utils.regex import compile_pattern
+from utils.batching import MicroBatcher, pipeline_batch
 
 logger = setup_logger(__name__)
 
@@ -27,8 +28,17 @@ class IntentRecognizer:
         self.tokenizer = None
         self.model = None
         self.classifier = None
-        self.rules = self._load_intent_rules()
+        # Compile once up front instead of per message
+        self.rules = {
+            intent_type: [compile_pattern(pattern) for pattern in patterns]
+            for intent_type, patterns in self._load_intent_rules().items()
+        }
         self._initialize_model()
+        # Concurrent requests share one batched classifier call
+        self.classifier_batcher = (
+            MicroBatcher(pipeline_batch(self.classifier), max_batch_size=32, max_latency_ms=5)
+            if self.classifier else None
+        )
     
     def _initialize_model(self):
         """Initialize the BERT model for intent classification."""
@@ -119,7 +129,7 @@ class IntentRecognizer:
     
     def _rule_based_intent(self, text: str) -> IntentPrediction:
         """Rule-based intent recognition."""
-        text_lower = text.lower()
+        # The compiled patterns are case-insensitive, so no lowercased copy is needed
         best_intent = IntentType.UNKNOWN
         best_confidence = 0.0
         
@@ -128,7 +138,7 @@ class IntentRecognizer:
             matches = 0
             
             for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
+                if pattern.search(text):
                     matches += 1
                     confidence += 0.3
             
@@ -148,8 +158,8 @@ class IntentRecognizer:
             # In production, you would use a fine-tuned BERT model for intent classification
             
             # For now, we'll map sentiment to basic intents
-            # Run classifier synchronously (HF pipelines are synchronous)
-            results = self.classifier(text)
+            # Batched with other in-flight requests, off the event loop
+            results = await self.classifier_batcher.submit(text)
 
             # results may be a list of label/confidence dicts; pick the best score
             confidence = 0.1
@@ -166,13 +176,14 @@ class IntentRecognizer:
                     confidence = best.get('score', 0.1)
 
             # Basic heuristic mapping from text to intents if classifier does not map to domain labels
-            if 'question' in text.lower() or '?' in text:
+            text_lower = text.lower()
+            if 'question' in text_lower or '?' in text:
                 return IntentPrediction(intent=IntentType.QUESTION, confidence=min(confidence + 0.2, 1.0))
-            elif any(word in text.lower() for word in ['help', 'assist']):
+            elif any(word in text_lower for word in ['help', 'assist']):
                 return IntentPrediction(intent=IntentType.HELP, confidence=min(confidence + 0.2, 1.0))
-            elif any(word in text.lower() for word in ['hello', 'hi', 'hey']):
+            elif any(word in text_lower for word in ['hello', 'hi', 'hey']):
                 return IntentPrediction(intent=IntentType.GREETING, confidence=min(confidence + 0.2, 1.0))
-            elif any(word in text.lower() for word in ['bye', 'goodbye']):
+            elif any(word in text_lower for word in ['bye', 'goodbye']):
                 return IntentPrediction(intent=IntentType.GOODBYE, confidence=min(confidence + 0.2, 1.0))
             else:
                 return IntentPrediction(intent=IntentType.UNKNOWN, confidence=confidence)
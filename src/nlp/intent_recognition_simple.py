@@ -1,10 +1,10 @@
 """
 Simplified intent recognition for basic demo (no heavy ML dependencies).
 """
-import re
 from typing import Dict, List
 from models import Intent, IntentType
 from utils.logger import setup_logger
+from utils.regex import compile_pattern
 
 logger = setup_logger(__name__)
 
@@ -13,7 +13,11 @@ class IntentRecognizer:
     """Rule-based intent recognition system for demo."""
     
     def __init__(self):
-        self.rules = self._load_intent_rules()
+        # Compile once up front instead of per message
+        self.rules = {
+            intent_type: [compile_pattern(pattern) for pattern in patterns]
+            for intent_type, patterns in self._load_intent_rules().items()
+        }
         logger.info("Simplified IntentRecognizer initialized")
     
     def _load_intent_rules(self) -> Dict[IntentType, List[str]]:
@@ -60,7 +64,7 @@ class IntentRecognizer:
     
     def _rule_based_intent(self, text: str) -> Intent:
         """Rule-based intent recognition."""
-        text_lower = text.lower()
+        # The compiled patterns are case-insensitive, so no lowercased copy is needed
         best_intent = IntentType.UNKNOWN
         best_confidence = 0.0
         
@@ -69,7 +73,7 @@ class IntentRecognizer:
             matches = 0
             
             for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
+                if pattern.search(text):
                     matches += 1
                     confidence += 0.3
             
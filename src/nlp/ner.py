@@ -1,12 +1,13 @@
 """
 Named Entity Recognition (NER) using spaCy and transformers.
 """
-import re
 from typing import List, Dict, Any
 from transformers import pipeline
 
 from models import Entity
 from utils.logger import setup_logger
+from utils.regex import compile_pattern
+from utils.batching import MicroBatcher, pipeline_batch
 
 logger = setup_logger(__name__)
 
@@ -16,8 +17,17 @@ class NamedEntityRecognizer:
     
     def __init__(self):
         self.ner_pipeline = None
-        self.patterns = self._load_patterns()
+        # Compile once up front instead of per message
+        self.patterns = {
+            entity_type: [compile_pattern(pattern) for pattern in patterns]
+            for entity_type, patterns in self._load_patterns().items()
+        }
         self._initialize_model()
+        # Concurrent requests share one batched NER call
+        self.ner_batcher = (
+            MicroBatcher(pipeline_batch(self.ner_pipeline), max_batch_size=32, max_latency_ms=5)
+            if self.ner_pipeline else None
+        )
     
     def _initialize_model(self):
         """Initialize the NER model."""
@@ -91,7 +101,7 @@ class NamedEntityRecognizer:
     async def _extract_with_transformer(self, text: str) -> List[Entity]:
         """Extract entities using transformer model."""
         try:
-            results = self.ner_pipeline(text)
+            results = await self.ner_batcher.submit(text)
             entities = []
             
             for result in results:
@@ -116,7 +126,7 @@ class NamedEntityRecognizer:
         
         for entity_type, patterns in self.patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     entity = Entity(
                         type=entity_type,
@@ -1,10 +1,10 @@
 """
 Simplified NER for basic demo (no heavy ML dependencies).
 """
-import re
 from typing import List, Dict, Any
 from models import Entity
 from utils.logger import setup_logger
+from utils.regex import compile_pattern
 
 logger = setup_logger(__name__)
 
@@ -13,7 +13,11 @@ class NamedEntityRecognizer:
     """Simplified NER using regex patterns only."""
     
     def __init__(self):
-        self.patterns = self._load_patterns()
+        # Compile once up front instead of per message
+        self.patterns = {
+            entity_type: [compile_pattern(pattern) for pattern in patterns]
+            for entity_type, patterns in self._load_patterns().items()
+        }
         logger.info("Simplified NamedEntityRecognizer initialized")
     
     def _load_patterns(self) -> Dict[str, List[str]]:
@@ -68,7 +72,7 @@ class NamedEntityRecognizer:
         
         for entity_type, patterns in self.patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     entity = Entity(
                         type=entity_type,
@@ -8,6 +8,7 @@ from typing import Dict, Any
 from models import Sentiment, SentimentType, EmotionType
 from config import settings
 from utils.logger import setup_logger
+from utils.batching import MicroBatcher, pipeline_batch
 
 logger = setup_logger(__name__)
 
@@ -20,6 +21,15 @@ class SentimentAnalyzer:
         self.emotion_classifier = None
         self.sentiment_classifier = None
         self._initialize_models()
+        # Concurrent requests share one batched call per classifier
+        self.sentiment_batcher = (
+            MicroBatcher(pipeline_batch(self.sentiment_classifier), max_batch_size=32, max_latency_ms=5)
+            if self.sentiment_classifier else None
+        )
+        self.emotion_batcher = (
+            MicroBatcher(pipeline_batch(self.emotion_classifier), max_batch_size=32, max_latency_ms=5)
+            if self.emotion_classifier else None
+        )
     
     def _initialize_models(self):
         """Initialize sentiment and emotion analysis models."""
@@ -89,7 +99,7 @@ class SentimentAnalyzer:
     async def _get_transformer_sentiment(self, text: str) -> Dict[str, Any]:
         """Get sentiment from transformer model."""
         try:
-            results = self.sentiment_classifier(text)
+            results = await self.sentiment_batcher.submit(text)
             
             # Map model labels to our sentiment types
             label_mapping = {
@@ -116,7 +126,7 @@ class SentimentAnalyzer:
     async def _get_emotion(self, text: str) -> EmotionType:
         """Get emotion from text."""
         try:
-            results = self.emotion_classifier(text)
+            results = await self.emotion_batcher.submit(text)
             
             # Map model labels to our emotion types
             label_mapping = {
@@ -1,6 +1,7 @@
 """
 Simplified sentiment analysis for basic demo.
 """
+import re
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from typing import Dict, Any
 
@@ -9,12 +10,33 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Emotion keywords in priority order (substring match on lowercased text)
+EMOTION_KEYWORDS = [
+    (EmotionType.JOY, ['happy', 'joy', 'excited', 'love', 'amazing', 'wonderful']),
+    (EmotionType.ANGER, ['angry', 'furious', 'mad', 'hate', 'terrible', 'awful']),
+    (EmotionType.SADNESS, ['sad', 'depressed', 'crying', 'disappointed', 'sorry']),
+    (EmotionType.FEAR, ['scared', 'afraid', 'worried', 'anxious', 'nervous']),
+    (EmotionType.SURPRISE, ['wow', 'amazing', 'surprised', 'unexpected']),
+    # There is no LOVE emotion type; affection keywords count as joy
+    (EmotionType.JOY, ['love', 'adore', 'cherish']),
+]
+
 
 class SentimentAnalyzer:
     """Simplified sentiment analysis using VADER only."""
     
     def __init__(self):
         self.vader_analyzer = SentimentIntensityAnalyzer()
+        
+        # Map each keyword to its highest-priority rule and scan for all of
+        # them at once; the lookahead also reports overlapping occurrences
+        self._emotion_rank = {}
+        for rank, (_, keywords) in enumerate(EMOTION_KEYWORDS):
+            for keyword in keywords:
+                self._emotion_rank.setdefault(keyword, rank)
+        self._emotion_pattern = re.compile(
+            "(?=(" + "|".join(map(re.escape, self._emotion_rank)) + "))"
+        )
         logger.info("Simplified SentimentAnalyzer initialized")
     
     async def analyze_sentiment(self, text: str) -> Sentiment:
@@ -46,30 +68,13 @@ class SentimentAnalyzer:
     
     def _detect_emotion(self, text: str) -> EmotionType:
         """Simple emotion detection based on keywords."""
-        text_lower = text.lower()
-        
-        # Joy keywords
-        if any(word in text_lower for word in ['happy', 'joy', 'excited', 'love', 'amazing', 'wonderful']):
-            return EmotionType.JOY
-        
-        # Anger keywords
-        if any(word in text_lower for word in ['angry', 'furious', 'mad', 'hate', 'terrible', 'awful']):
-            return EmotionType.ANGER
-        
-        # Sadness keywords
-        if any(word in text_lower for word in ['sad', 'depressed', 'crying', 'disappointed', 'sorry']):
-            return EmotionType.SADNESS
-        
-        # Fear keywords
-        if any(word in text_lower for word in ['scared', 'afraid', 'worried', 'anxious', 'nervous']):
-            return EmotionType.FEAR
-        
-        # Surprise keywords
-        if any(word in text_lower for word in ['wow', 'amazing', 'surprised', 'unexpected']):
-            return EmotionType.SURPRISE
+        ranks = [
+            self._emotion_rank[match.group(1)]
+            for match in self._emotion_pattern.finditer(text.lower())
+        ]
         
-        # Love keywords
-        if any(word in text_lower for word in ['love', 'adore', 'cherish']):
-            return EmotionType.LOVE
+        # The highest-priority rule with a matching keyword wins
+        if ranks:
+            return EMOTION_KEYWORDS[min(ranks)][0]
         
-        return EmotionType.NEUTRAL
\ No newline at end of file
+        return EmotionType.NEUTRAL
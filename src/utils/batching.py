@@ -0,0 +1,99 @@
+"""
+Micro-batching of concurrent model calls.
+"""
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MicroBatcher:
+    """Coalesces concurrent ``submit`` calls into batched calls of ``process_batch``.
+
+    ``process_batch`` is a blocking function that takes a list of items and
+    returns one result per item, in order. A single worker task collects up to
+    ``max_batch_size`` items, waiting at most ``max_latency_ms`` after the first
+    one arrives, then runs the batch in the default executor so the event loop
+    stays responsive.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_latency_ms: float = 10.0
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result from the next batch."""
+        if self._worker is None or self._worker.done():
+            # Created lazily so the queue and task bind to the running loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self):
+        """Stop the worker task."""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(loop, batch)
+
+    async def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple[Any, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        try:
+            results = await loop.run_in_executor(None, self.process_batch, items)
+        except Exception as e:
+            logger.error("Batch of {} items failed: {}", len(items), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # The caller may have been cancelled while the batch ran
+            if not future.done():
+                future.set_result(result)
+
+
+def pipeline_batch(pipe: Callable[..., Any]) -> Callable[[List[str]], List[Any]]:
+    """Adapt a Hugging Face pipeline to the ``process_batch`` contract.
+    
+    Given a list of texts a pipeline returns one output per text, but a
+    top-1 classifier yields a bare dict where a single-text call would have
+    yielded a list; each output is wrapped so every result is a list.
+    """
+    def process_batch(texts: List[str]) -> List[Any]:
+        outputs = pipe(texts, batch_size=len(texts))
+        return [output if isinstance(output, list) else [output] for output in outputs]
+    
+    return process_batch
@@ -0,0 +1,37 @@
+"""
+Time-based memoization for async methods.
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable
+
+
+def async_ttl_cache(ttl_seconds: float):
+    """Memoize an argument-less async method per instance for ``ttl_seconds``.
+
+    Callers that miss at the same time wait on one lock, so only the first
+    one computes and the rest reuse its result (single-flight).
+    """
+    def decorator(method: Callable[[Any], Awaitable[Any]]):
+        attr = f"_ttl_cache_{method.__name__}"
+
+        @functools.wraps(method)
+        async def wrapper(self):
+            entry = self.__dict__.get(attr)
+            if entry is None:
+                entry = self.__dict__[attr] = {"lock": asyncio.Lock(), "expires": 0.0, "value": None}
+
+            if time.monotonic() < entry["expires"]:
+                return entry["value"]
+
+            async with entry["lock"]:
+                # Another caller may have refreshed the entry while we waited
+                if time.monotonic() >= entry["expires"]:
+                    entry["value"] = await method(self)
+                    entry["expires"] = time.monotonic() + ttl_seconds
+                return entry["value"]
+
+        return wrapper
+
+    return decorator
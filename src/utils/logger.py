@@ -7,9 +7,15 @@ from pathlib import Path
 from loguru import logger
 from config import settings
 
+# Handlers are global to loguru, so they only need to be installed once
+_configured = False
+
 
 def setup_logger(name: str = None):
     """Setup and configure logger."""
+    global _configured
+    if _configured:
+        return logger
     
     # Remove default handler
     logger.remove()
@@ -36,4 +42,5 @@ def setup_logger(name: str = None):
         compression="zip"
     )
     
+    _configured = True
     return logger
\ No newline at end of file
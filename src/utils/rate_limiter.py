@@ -0,0 +1,41 @@
+"""
+Per-user concurrency limiting for chat endpoints.
+"""
+from typing import Dict
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class UserConcurrencyLimiter:
+    """Caps the number of in-flight requests a single user can hold.
+    
+    State lives in the worker process and is only touched from the event
+    loop, so plain dict updates need no locking.
+    """
+    
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max_concurrent
+        self._in_flight: Dict[str, int] = {}
+    
+    def try_acquire(self, user_id: str) -> bool:
+        """Reserve a slot for the user; return False if they are at the limit."""
+        current = self._in_flight.get(user_id, 0)
+        if current >= self.max_concurrent:
+            logger.warning("User {} exceeded {} concurrent requests", user_id, self.max_concurrent)
+            return False
+        self._in_flight[user_id] = current + 1
+        return True
+    
+    def release(self, user_id: str):
+        """Free a slot previously reserved with try_acquire."""
+        remaining = self._in_flight.get(user_id, 0) - 1
+        if remaining > 0:
+            self._in_flight[user_id] = remaining
+        else:
+            self._in_flight.pop(user_id, None)
+    
+    def in_flight(self, user_id: str) -> int:
+        """Number of requests currently held by the user."""
+        return self._in_flight.get(user_id, 0)
@@ -0,0 +1,35 @@
+"""
+Regex compilation with an optional RE2 backend.
+"""
+import re
+
+# Use google-re2 when installed: linear-time matching, no catastrophic backtracking
+try:
+    import re2  # type: ignore
+    _HAS_RE2 = True
+except Exception:
+    re2 = None
+    _HAS_RE2 = False
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def compile_pattern(pattern: str, ignore_case: bool = True):
+    """Compile a pattern with RE2 if available, otherwise with the stdlib ``re``.
+    
+    Case-insensitivity is passed as an inline ``(?i)`` flag, which both
+    engines understand. Patterns RE2 cannot handle (e.g. backreferences)
+    fall back to ``re``.
+    """
+    if ignore_case:
+        pattern = "(?i)" + pattern
+    
+    if _HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.debug("RE2 cannot compile {!r}, using re: {}", pattern, e)
+    
+    return re.compile(pattern)
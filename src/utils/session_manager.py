@@ -1,7 +1,7 @@
 """
 Session management for maintaining conversation context.
 """
-import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 import uuid
@@ -17,8 +17,9 @@ class SessionManager:
     """Manages user sessions and conversation context."""
     
     def __init__(self):
-        # In-memory storage for now - in production, this would use Redis
-        self.sessions: Dict[str, Session] = {}
+        # In-memory storage for now - in production, this would use Redis.
+        # Kept in last-activity order so expiry only has to look at the head.
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
         self.session_timeout = timedelta(seconds=settings.session_timeout)
         logger.info("SessionManager initialized")
     
@@ -34,7 +35,7 @@ class SessionManager:
             if session_id in self.sessions:
                 session = self.sessions[session_id]
                 if self._is_session_valid(session):
-                    session.last_activity = datetime.utcnow()
+                    self._touch(session)
                     return session
                 else:
                     # Session expired, remove it
@@ -85,7 +86,7 @@ class SessionManager:
                 session = self.sessions[session_id]
                 # Append turn to the conversation_turns list (Session model uses conversation_turns)
                 session.conversation_turns.append(turn)
-                session.last_activity = datetime.utcnow()
+                self._touch(session)
                 
                 # Limit context length to prevent memory issues
                 max_length = settings.max_context_length
@@ -110,23 +111,29 @@ class SessionManager:
     async def cleanup_expired_sessions(self):
         """Clean up expired sessions."""
         try:
-            expired_sessions = []
-            current_time = datetime.utcnow()
-            
-            for session_id, session in self.sessions.items():
-                if current_time - session.last_activity > self.session_timeout:
-                    expired_sessions.append(session_id)
-            
-            for session_id in expired_sessions:
-                del self.sessions[session_id]
-                logger.info(f"Cleaned up expired session: {session_id}")
-            
-            if expired_sessions:
-                logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
+            expired_count = 0
+            cutoff = datetime.utcnow() - self.session_timeout
+            
+            # Sessions are ordered by last activity, so stop at the first live one
+            while self.sessions:
+                session_id, session = next(iter(self.sessions.items()))
+                if session.last_activity >= cutoff:
+                    break
+                self.sessions.popitem(last=False)
+                expired_count += 1
+                logger.debug("Cleaned up expired session: {}", session_id)
+            
+            if expired_count:
+                logger.info("Cleaned up {} expired sessions", expired_count)
                 
         except Exception as e:
             logger.error(f"Error cleaning up expired sessions: {e}")
     
+    def _touch(self, session: Session):
+        """Mark a session as active and move it to the end of the expiry order."""
+        session.last_activity = datetime.utcnow()
+        self.sessions.move_to_end(session.id)
+    
     def _is_session_valid(self, session: Session) -> bool:
         """Check if session is still valid (not expired)."""
         return datetime.utcnow() - session.last_activity < self.session_timeout
@@ -196,8 +203,8 @@ class RedisSessionManager(SessionManager):
             session_data = self.redis_client.get(f"session:{session_id}")
             
             if session_data:
-                session_dict = json.loads(session_data)
-                session = Session(**session_dict)
+                # Parse and validate in one pass in pydantic-core
+                session = Session.model_validate_json(session_data)
                 
                 # Check if session is valid
                 if self._is_session_valid(session):
@@ -225,7 +232,7 @@ class RedisSessionManager(SessionManager):
     async def _save_session_to_redis(self, session: Session):
         """Save session to Redis."""
         try:
-            session_data = session.json()
+            session_data = session.model_dump_json()
             self.redis_client.setex(
                 f"session:{session.id}",
                 int(self.session_timeout.total_seconds()),
@@ -6,6 +6,8 @@ import sys
 import os
 import asyncio
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -17,6 +19,7 @@ from nlp.sentiment_analysis_simple import SentimentAnalyzer
 from nlp.ner_simple import NamedEntityRecognizer
 
 
+@pytest.mark.asyncio
 async def test_nlp_components():
     """Test NLP components."""
     print("Testing NLP Components...")
@@ -34,7 +37,7 @@ async def test_nlp_components():
     
     for message in test_messages:
         intent = await recognizer.recognize_intent(message)
-        print(f"  '{message}' -> {intent.intent.value} (confidence: {intent.confidence:.2f})")
+        print(f"  '{message}' -> {intent.value}")
     
     # Test sentiment analysis
     print("\n2. Testing Sentiment Analysis:")
@@ -48,8 +51,7 @@ async def test_nlp_components():
     
     for message in sentiment_messages:
         sentiment = await analyzer.analyze_sentiment(message)
-        emotion_str = f" ({sentiment.emotion.value})" if sentiment.emotion else ""
-        print(f"  '{message}' -> {sentiment.sentiment.value}{emotion_str} (confidence: {sentiment.confidence:.2f})")
+        print(f"  '{message}' -> {sentiment.value}")
     
     # Test NER
     print("\n3. Testing Named Entity Recognition:")
@@ -90,37 +92,34 @@ def test_api_structure():
         print(f"  ✗ Error creating FastAPI app: {e}")
 
 
+@pytest.mark.asyncio
 async def test_chat_functionality():
     """Test end-to-end chat functionality."""
     print("\n5. Testing Chat Functionality:")
-    try:
-        from api.dependencies import get_chat_manager
-        chat_manager = get_chat_manager()
-        
-        # Test messages
-        test_requests = [
-            ChatRequest(message="Hello!", user_id="test_user", platform=Platform.API),
-            ChatRequest(message="What can you do?", user_id="test_user", platform=Platform.API),
-            ChatRequest(message="Thank you!", user_id="test_user", platform=Platform.API),
-            ChatRequest(message="Goodbye!", user_id="test_user", platform=Platform.API),
-        ]
-        
-        for request in test_requests:
-            response = await chat_manager.process_message(request)
-            print(f"  User: {request.message}")
-            print(f"  Bot: {response.response}")
-            print(f"  Intent: {response.intent.intent.value if response.intent else 'unknown'}")
-            print(f"  Sentiment: {response.sentiment.sentiment.value if response.sentiment else 'unknown'}")
-            print(f"  Confidence: {response.confidence:.2f}")
-            print()
-        
-        print("  ✓ Chat functionality working correctly")
-        
-    except Exception as e:
-        print(f"  ✗ Error in chat functionality: {e}")
-        import traceback
-        traceback.print_exc()
-
+    from api.dependencies import build_chat_manager
+    chat_manager = build_chat_manager()
+    
+    # Test messages
+    test_requests = [
+        ChatRequest(message="Hello!", user_id="test_user", platform=Platform.API),
+        ChatRequest(message="What can you do?", user_id="test_user", platform=Platform.API),
+        ChatRequest(message="Thank you!", user_id="test_user", platform=Platform.API),
+        ChatRequest(message="Goodbye!", user_id="test_user", platform=Platform.API),
+    ]
+    
+    for request in test_requests:
+        response = await chat_manager.process_message(request)
+        print(f"  User: {request.message}")
+        print(f"  Bot: {response.message}")
+        print(f"  Intent: {response.intent.value}")
+        print(f"  Sentiment: {response.sentiment.value}")
+        print(f"  Confidence: {response.confidence:.2f}")
+        print()
+        assert response.message
+        # The fallback reply carries confidence 0.1; a processed message does not
+        assert response.confidence > 0.1
+    
+    print("  ✓ Chat functionality working correctly")
 
 async def main():
     """Run all tests."""
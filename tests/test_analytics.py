@@ -0,0 +1,74 @@
+"""
+Tests for the incremental in-memory analytics aggregates.
+"""
+import sys
+import pathlib
+from collections import deque
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from analytics import InMemoryAnalytics
+from models import AnalyticsEvent, Platform
+
+
+def message_event(session_id, intent, sentiment, response_time_ms, platform=Platform.API):
+    return AnalyticsEvent(
+        event_type="message_processed",
+        user_id="user",
+        session_id=session_id,
+        platform=platform,
+        data={
+            "intent": {"intent": intent},
+            "sentiment": {"sentiment": sentiment},
+            "response_time_ms": response_time_ms
+        }
+    )
+
+
+def test_stats_aggregate_logged_events():
+    analytics = InMemoryAnalytics()
+    analytics.log_event(message_event("s1", "greeting", "positive", 10.0))
+    analytics.log_event(message_event("s1", "question", "neutral", 20.0))
+    analytics.log_event(message_event("s2", "greeting", "positive", 30.0, Platform.SLACK))
+    analytics.log_event(AnalyticsEvent(event_type="session_started", user_id="user", session_id="s3"))
+    
+    stats = analytics.get_stats()
+    assert stats["total_conversations"] == 2
+    assert stats["total_messages"] == 3
+    assert stats["average_conversation_length"] == 1.5
+    assert stats["intent_distribution"] == {"greeting": 2, "question": 1}
+    assert stats["sentiment_distribution"] == {"positive": 2, "neutral": 1}
+    assert stats["platform_distribution"] == {"api": 3, "slack": 1}
+    assert stats["average_response_time_ms"] == 20.0
+
+
+def test_clear_events_resets_counters():
+    analytics = InMemoryAnalytics()
+    analytics.log_event(message_event("s1", "greeting", "positive", 10.0))
+    analytics.clear_events()
+    
+    assert analytics.get_stats()["total_messages"] == 0
+    assert len(analytics.events) == 0
+
+
+def test_event_log_is_bounded_but_totals_are_not():
+    analytics = InMemoryAnalytics()
+    analytics.events = deque(maxlen=2)
+    for i in range(5):
+        analytics.log_event(message_event(f"s{i}", "greeting", "positive", 10.0))
+    
+    assert [event.session_id for event in analytics.events] == ["s3", "s4"]
+    assert analytics.get_stats()["total_messages"] == 5
+
+
+def test_log_events_counts_a_batch():
+    analytics = InMemoryAnalytics()
+    analytics.log_events([message_event(f"s{i}", "greeting", "positive", 10.0) for i in range(3)])
+    
+    stats = analytics.get_stats()
+    assert stats["total_conversations"] == 3
+    assert stats["intent_distribution"] == {"greeting": 3}
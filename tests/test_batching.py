@@ -0,0 +1,56 @@
+"""
+Tests for the micro-batching helper.
+"""
+import sys
+import asyncio
+import pathlib
+
+import pytest
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from utils.batching import MicroBatcher, pipeline_batch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_a_batch():
+    batches = []
+    
+    def double_all(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+    
+    batcher = MicroBatcher(double_all, max_batch_size=4, max_latency_ms=50)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+    await batcher.close()
+    
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert [len(batch) for batch in batches] == [4, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    def fail(items):
+        raise RuntimeError("model unavailable")
+    
+    batcher = MicroBatcher(fail, max_latency_ms=5)
+    results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+    await batcher.close()
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_pipeline_batch_gives_every_result_list_shape():
+    calls = []
+    
+    def classifier(texts, batch_size):
+        calls.append(batch_size)
+        return [{"label": text.upper(), "score": 1.0} for text in texts]
+    
+    results = pipeline_batch(classifier)(["a", "b"])
+    assert calls == [2]
+    assert results == [[{"label": "A", "score": 1.0}], [{"label": "B", "score": 1.0}]]
@@ -0,0 +1,48 @@
+"""
+Tests for the async TTL cache decorator.
+"""
+import sys
+import pathlib
+import asyncio
+
+import pytest
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from utils.caching import async_ttl_cache
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @async_ttl_cache(ttl_seconds=60)
+    async def compute(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"calls": self.calls}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    counter = Counter()
+    results = await asyncio.gather(*(counter.compute() for _ in range(5)))
+
+    assert counter.calls == 1
+    assert all(result == {"calls": 1} for result in results)
+    assert await counter.compute() == {"calls": 1}
+
+
+@pytest.mark.asyncio
+async def test_entries_are_per_instance_and_expire():
+    first, second = Counter(), Counter()
+    await first.compute()
+    await second.compute()
+    assert (first.calls, second.calls) == (1, 1)
+
+    first._ttl_cache_compute["expires"] = 0.0
+    assert await first.compute() == {"calls": 2}
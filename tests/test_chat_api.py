@@ -0,0 +1,116 @@
+"""
+Tests for the chat API endpoints using the simplified NLP modules.
+"""
+import sys
+import asyncio
+import json
+import pathlib
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from auth.repository import user_repository
+
+
+def _sse_events(body: str):
+    return [json.loads(chunk[len("data: "):]) for chunk in body.split("\n\n") if chunk.startswith("data: ")]
+
+
+def test_chat_stream_yields_deltas_then_done():
+    client = TestClient(create_app())
+    response = client.post("/chat/stream", json={"message": "Hello there!", "user_id": "stream_user"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _sse_events(response.text)
+    deltas = [e["delta"] for e in events if "delta" in e]
+    assert deltas
+    assert events[-1]["done"] is True
+    assert events[-1]["session_id"]
+
+    session = client.get(f"/session/{events[-1]['session_id']}").json()
+    assert session["conversation_turns"][-1]["bot_response"]["text"] == "".join(deltas)
+
+
+def test_chat_rejects_user_over_concurrency_limit():
+    app = create_app()
+    client = TestClient(app)
+    limiter = app.state.chat_limiter
+    for _ in range(limiter.max_concurrent):
+        assert limiter.try_acquire("busy_user")
+
+    response = client.post("/chat", json={"message": "Hello", "user_id": "busy_user"})
+    assert response.status_code == 429
+
+    limiter.release("busy_user")
+    response = client.post("/chat", json={"message": "Hello", "user_id": "busy_user"})
+    assert response.status_code == 200
+    assert limiter.in_flight("busy_user") == limiter.max_concurrent - 1
+
+
+def test_ready_reports_503_until_warmup_has_run(monkeypatch):
+    async def no_indexes():
+        pass
+
+    # Startup also creates MongoDB indexes; skip them rather than wait out the server timeout
+    monkeypatch.setattr(user_repository, "create_indexes", no_indexes)
+    app = create_app()
+    assert TestClient(app).get("/ready").status_code == 503
+
+    # Entering the client runs the startup hooks, including warmup
+    with TestClient(app) as client:
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+    assert app.state.chat_manager.session_manager.sessions == {}
+
+
+def test_chat_records_processing_time():
+    client = TestClient(create_app())
+    session_id = client.post("/chat", json={"message": "Hi", "user_id": "timing_user"}).json()["session_id"]
+
+    turn = client.get(f"/session/{session_id}").json()["conversation_turns"][-1]
+    assert turn["processing_time_ms"] > 0
+    assert client.get("/analytics/stats").json()["average_response_time_ms"] > 0
+
+
+def test_health_answers_head_probes():
+    client = TestClient(create_app())
+    assert client.head("/health").status_code == 200
+    assert client.get("/health").json()["status"] == "healthy"
+
+
+def test_stream_slot_is_released_when_client_disconnects_before_first_chunk():
+    app = create_app()
+    body = json.dumps({"message": "Hello there!", "user_id": "u1"}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/chat/stream", "raw_path": b"/chat/stream",
+        "root_path": "", "query_string": b"", "server": ("test", 80), "client": ("test", 1234),
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    }
+
+    async def disconnect_early():
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            # A slow client: the disconnect lands while the headers are still being sent
+            if message["type"] == "http.response.start":
+                await asyncio.sleep(0.05)
+
+        await app(scope, receive, send)
+
+    for _ in range(5):
+        asyncio.run(disconnect_early())
+    assert app.state.chat_limiter.in_flight("u1") == 0
@@ -0,0 +1,48 @@
+"""
+Tests for single-pass FAQ keyword matching.
+"""
+import sys
+import pathlib
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from ai.faq_matcher import FAQMatcher
+
+FAQS = {
+    "what can you do": "capabilities",
+    "what is your purpose": "purpose",
+    "who created you": "creator",
+}
+
+
+def scan(text, min_fraction):
+    """The per-FAQ substring scan the matcher replaces."""
+    text_lower = text.lower()
+    for question, answer in FAQS.items():
+        keywords = question.lower().split()
+        if sum(keyword in text_lower for keyword in keywords) >= len(keywords) * min_fraction:
+            return answer
+    return None
+
+
+def test_matches_agree_with_substring_scan():
+    messages = [
+        "What can you do?",
+        "Tell me WHAT your purpose is",  # "your" also contains "you"
+        "who made you",
+        "Who created this?",
+        "nothing relevant here",
+    ]
+    for min_fraction in (1.0, 0.7):
+        matcher = FAQMatcher(FAQS, min_fraction=min_fraction)
+        for message in messages:
+            assert matcher.match(message) == scan(message, min_fraction), (message, min_fraction)
+
+
+def test_keywords_inside_longer_keywords_are_found():
+    matcher = FAQMatcher({"you": "short", "your purpose": "long"})
+    assert matcher.match("your") == "short"
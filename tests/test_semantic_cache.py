@@ -0,0 +1,52 @@
+"""
+Tests for the embedding-similarity response cache.
+"""
+import sys
+import pathlib
+
+import numpy as np
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from ai.semantic_cache import SemanticCache
+
+VOCABULARY = ["weather", "today", "tomorrow", "capital", "france", "what", "is", "the"]
+
+
+def bag_of_words(text: str) -> np.ndarray:
+    words = text.lower().replace("?", "").split()
+    return np.array([words.count(word) for word in VOCABULARY], dtype=np.float32)
+
+
+def test_paraphrase_hits_and_unrelated_misses():
+    cache = SemanticCache(bag_of_words, threshold=0.9)
+    cache.store(cache.embed("What is the weather today?"), "Sunny")
+    
+    assert cache.lookup(cache.embed("the weather today what is")) == "Sunny"
+    assert cache.lookup(cache.embed("What is the capital of France?")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_full_cache_evicts_least_recently_used():
+    cache = SemanticCache(bag_of_words, threshold=0.99, max_size=2)
+    cache.store(cache.embed("weather today"), "a")
+    cache.store(cache.embed("weather tomorrow"), "b")
+    cache.lookup(cache.embed("weather today"))  # refresh "a"
+    cache.store(cache.embed("capital france"), "c")
+    
+    assert len(cache) == 2
+    assert cache.lookup(cache.embed("weather tomorrow")) is None
+    assert cache.lookup(cache.embed("weather today")) == "a"
+    assert cache.lookup(cache.embed("capital france")) == "c"
+
+
+def test_expired_entries_are_not_returned():
+    cache = SemanticCache(bag_of_words, ttl_seconds=-1)
+    cache.store(cache.embed("weather today"), "a")
+    
+    assert cache.lookup(cache.embed("weather today")) is None
+    assert len(cache) == 0
@@ -0,0 +1,26 @@
+"""
+Tests for the keyword-based emotion detection in the simple sentiment analyzer.
+"""
+import sys
+import pathlib
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from models import EmotionType
+from nlp.sentiment_analysis_simple import SentimentAnalyzer
+
+
+def test_detect_emotion_uses_priority_order():
+    analyzer = SentimentAnalyzer()
+    # "amazing" is both joy and surprise; joy is checked first
+    assert analyzer._detect_emotion("Wow, that is AMAZING") == EmotionType.JOY
+    # sadness outranks fear even when it appears later in the text
+    assert analyzer._detect_emotion("I'm worried and sad") == EmotionType.SADNESS
+    # overlapping keywords ("nervou[s]ad") are still both found
+    assert analyzer._detect_emotion("nervousad") == EmotionType.SADNESS
+    assert analyzer._detect_emotion("I adore this") == EmotionType.JOY
+    assert analyzer._detect_emotion("The weather is mild") == EmotionType.NEUTRAL
@@ -0,0 +1,33 @@
+"""
+Tests for in-memory session expiry.
+"""
+import sys
+import asyncio
+import pathlib
+from datetime import datetime, timedelta
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from models import Platform
+from utils.session_manager import SessionManager
+
+
+def test_cleanup_evicts_only_expired_sessions_in_activity_order():
+    manager = SessionManager()
+    for session_id in ("a", "b", "c"):
+        asyncio.run(manager.get_or_create_session(session_id, "user", Platform.API))
+
+    # Touching "a" moves it behind "b" and "c" in the expiry order
+    asyncio.run(manager.get_or_create_session("a", "user", Platform.API))
+    assert list(manager.sessions) == ["b", "c", "a"]
+
+    stale = datetime.utcnow() - manager.session_timeout - timedelta(seconds=1)
+    manager.sessions["b"].last_activity = stale
+    manager.sessions["c"].last_activity = stale
+
+    asyncio.run(manager.cleanup_expired_sessions())
+    assert list(manager.sessions) == ["a"]
@@ -0,0 +1,68 @@
+"""
+Tests for the verified-token cache used by get_current_user.
+"""
+import sys
+import time
+import pathlib
+from datetime import datetime
+
+# Ensure 'src' is on sys.path so modules import correctly
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = str(ROOT / 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from auth.models import UserProfile
+from auth.utils import TokenCache
+
+
+def profile(user_id):
+    return UserProfile(
+        id=user_id,
+        username=f"user_{user_id}",
+        email=f"{user_id}@example.com",
+        created_at=datetime.utcnow()
+    )
+
+
+def test_entries_expire_with_the_token():
+    cache = TokenCache(ttl_seconds=60)
+    cache.put("live", profile("u1"), time.time() + 30)
+    cache.put("expired", profile("u1"), time.time() - 1)
+
+    assert cache.get("live").id == "u1"
+    assert cache.get("expired") is None
+
+
+def test_token_without_exp_is_capped_by_the_ttl():
+    cache = TokenCache(ttl_seconds=0)
+    cache.put("no-exp", profile("u1"))
+    assert cache.get("no-exp") is None
+
+    cache = TokenCache(ttl_seconds=60)
+    cache.put("no-exp", profile("u1"))
+    assert cache.get("no-exp").id == "u1"
+
+
+def test_least_recently_used_token_is_evicted():
+    cache = TokenCache(max_size=2)
+    expires_at = time.time() + 30
+    cache.put("a", profile("u1"), expires_at)
+    cache.put("b", profile("u2"), expires_at)
+    cache.get("a")
+    cache.put("c", profile("u3"), expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_invalidate_user_drops_all_their_tokens():
+    cache = TokenCache()
+    expires_at = time.time() + 30
+    cache.put("a", profile("u1"), expires_at)
+    cache.put("b", profile("u1"), expires_at)
+    cache.put("c", profile("u2"), expires_at)
+
+    cache.invalidate_user("u1")
+    assert cache.get("a") is None and cache.get("b") is None
+    assert cache.get("c").id == "u2"